@@ -8,89 +8,101 @@ dependency checking, logging setup, and global exception handling.
 
 import sys
 import os
+import stat
 import logging
-import traceback
+import functools
+import importlib.util
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Optional, Tuple
+
+# Application directory, resolved once
+APP_DIR = Path(__file__).resolve().parent
 
 # Add the src directory to the Python path
-src_path = Path(__file__).parent / "src"
+src_path = APP_DIR / "src"
 if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
 
-# Import after path setup
-try:
-    from PySide6.QtWidgets import QApplication, QMessageBox
-    from PySide6.QtCore import Qt, QTimer
-    from PySide6.QtGui import QFont, QIcon
-except ImportError as e:
-    print(f"Error: PySide6 not found. Please install it with: pip install PySide6")
-    print(f"Import error: {e}")
-    sys.exit(1)
-
-from src.core.application import ScannerExtensionApp
 from src.core.exceptions import ScannerExtensionError, ConfigurationError
+from src.utils.logging_utils import create_buffered_file_handler
+
+if TYPE_CHECKING:
+    from PySide6.QtWidgets import QApplication
 
+# Double-dash arguments that are passed through to Qt
+_QT_PASSTHROUGH_ARGS = frozenset(('--help', '--version'))
 
-def check_dependencies() -> List[str]:
+# Application log file location
+LOG_FILE = Path.home() / ".scanner_extension" / "logs" / "scanner_extension.log"
+
+# Boolean command line flags mapped to their parsed argument keys
+_BOOL_FLAGS = {
+    '--debug': 'debug',
+    '--quiet': 'quiet',
+    '--help': 'help',
+    '-h': 'help',
+    '--version': 'version',
+    '-v': 'version',
+    '--no-monitoring': 'no_monitoring',
+}
+
+
+@functools.lru_cache(maxsize=None)
+def check_dependencies() -> Tuple[str, ...]:
     """
     Check if all required dependencies are available.
 
+    Only the import system's finders are consulted, so no package code is
+    executed by the check.
+
     Returns:
-        List[str]: List of missing dependencies (empty if all present)
+        Tuple[str, ...]: Missing dependencies (empty if all present)
     """
     missing_deps = []
 
-    # Required packages with their import names
+    # Required packages with the import names that satisfy them
     required_packages = [
-        ("PySide6", "PySide6.QtWidgets"),
-        ("PyPDF2 or pypdf", "PyPDF2"),  # We'll check for either
-        ("Pillow", "PIL"),
-        ("pathlib", "pathlib"),  # Should be built-in for Python 3.4+
+        ("PySide6", ("PySide6",)),
+        ("PyPDF2 or pypdf", ("PyPDF2", "pypdf")),
+        ("Pillow", ("PIL",)),
     ]
 
-    for package_name, import_name in required_packages:
-        try:
-            if import_name == "PyPDF2":
-                # Try PyPDF2 first, then pypdf
-                try:
-                    import PyPDF2
-                except ImportError:
-                    import pypdf
-            else:
-                __import__(import_name)
-        except ImportError:
+    for package_name, import_names in required_packages:
+        if not any(importlib.util.find_spec(name) is not None for name in import_names):
             missing_deps.append(package_name)
 
-    return missing_deps
+    return tuple(missing_deps)
+
 
+def setup_logging(args: dict) -> None:
+    """
+    Configure application logging system.
 
-def setup_logging() -> None:
-    """Configure application logging system."""
+    Args:
+        args: Parsed command line arguments from parse_command_line_args()
+    """
     # Create logs directory
-    log_dir = Path.home() / ".scanner_extension" / "logs"
-    log_dir.mkdir(parents=True, exist_ok=True)
+    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
 
     # Determine log level
     log_level = logging.INFO
-    if "--debug" in sys.argv:
+    if args['debug']:
         log_level = logging.DEBUG
-    elif "--quiet" in sys.argv:
+    elif args['quiet']:
         log_level = logging.WARNING
 
     # Configure logging format
     log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     date_format = '%Y-%m-%d %H:%M:%S'
 
-    # Create file handler
-    log_file = log_dir / "scanner_extension.log"
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setLevel(log_level)
-    file_handler.setFormatter(logging.Formatter(log_format, date_format))
+    # Create file handler, buffered so startup lines reach disk in one write
+    buffered_handler = create_buffered_file_handler(
+        LOG_FILE, logging.Formatter(log_format, date_format), log_level
+    )
 
     # Create console handler (only if not quiet mode)
-    handlers = [file_handler]
-    if "--quiet" not in sys.argv:
+    handlers = [buffered_handler]
+    if not args['quiet']:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(log_level)
         console_handler.setFormatter(logging.Formatter(log_format, date_format))
@@ -105,19 +117,26 @@ def setup_logging() -> None:
         force=True  # Override any existing configuration
     )
 
-    # Log startup information
-    logging.info("=" * 60)
-    logging.info("Scanner Extension Starting Up")
-    logging.info("=" * 60)
-    logging.info(f"Python version: {sys.version}")
-    logging.info(f"Application directory: {Path(__file__).parent}")
-    logging.info(f"Log level: {logging.getLevelName(log_level)}")
+    # Log startup information as a single record
+    banner = "\n".join((
+        "=" * 60,
+        "Scanner Extension Starting Up",
+        "=" * 60,
+        f"Python version: {sys.version}",
+        f"Application directory: {APP_DIR}",
+        f"Log level: {logging.getLevelName(log_level)}",
+    ))
+    logging.info("%s", banner)
 
 
 def handle_exceptions(exc_type, exc_value, exc_traceback) -> None:
     """
     Global exception handler for unhandled exceptions.
 
+    Once the application is initialized and running its event loop, errors
+    (typically raised from Qt slots) are logged and reported without closing
+    the application. Errors before that point are fatal.
+
     Args:
         exc_type: Exception type
         exc_value: Exception value
@@ -128,28 +147,44 @@ def handle_exceptions(exc_type, exc_value, exc_traceback) -> None:
         sys.__excepthook__(exc_type, exc_value, exc_traceback)
         return
 
+    # Format error message
+    error_msg = f"An unexpected error occurred:\n\n{exc_value}"
+
+    try:
+        from PySide6.QtWidgets import QApplication, QMessageBox
+        app = QApplication.instance()
+    except Exception:
+        app = None
+
+    # Application is up: report the error and keep running
+    if app is not None and getattr(app, 'is_initialized', False) and not app.is_shutting_down:
+        logging.error(
+            "Uncaught exception",
+            exc_info=(exc_type, exc_value, exc_traceback)
+        )
+        try:
+            QMessageBox.critical(app.main_window, "Unexpected Error", error_msg)
+        except Exception:
+            print(f"\nERROR: {error_msg}", file=sys.stderr)
+        return
+
     # Log the exception
     logging.critical(
         "Uncaught exception occurred",
         exc_info=(exc_type, exc_value, exc_traceback)
     )
 
-    # Format error message
-    error_msg = f"An unexpected error occurred:\n\n{exc_value}"
-
     # Try to show GUI error dialog if possible
     try:
-        # Check if QApplication exists
-        app = QApplication.instance()
         if app is not None:
             msg_box = QMessageBox()
             msg_box.setIcon(QMessageBox.Critical)
             msg_box.setWindowTitle("Scanner Extension - Critical Error")
             msg_box.setText("A critical error has occurred and the application must close.")
+            # The full traceback was already written by logging.critical above
             msg_box.setDetailedText(
-                f"Exception Type: {exc_type.__name__}\n"
-                f"Message: {exc_value}\n\n"
-                f"Traceback:\n{''.join(traceback.format_tb(exc_traceback))}"
+                f"{exc_type.__name__}: {exc_value}\n\n"
+                f"See the log file for the full traceback:\n{LOG_FILE}"
             )
             msg_box.setStandardButtons(QMessageBox.Ok)
             msg_box.exec()
@@ -172,6 +207,8 @@ def show_startup_error(title: str, message: str, details: Optional[str] = None)
         details: Optional detailed error information
     """
     try:
+        from PySide6.QtWidgets import QApplication, QMessageBox
+
         # Create minimal QApplication for error dialog
         if not QApplication.instance():
             app = QApplication([])
@@ -204,22 +241,24 @@ def parse_command_line_args() -> dict:
         dict: Parsed arguments
     """
     args = {
-        'debug': '--debug' in sys.argv,
-        'quiet': '--quiet' in sys.argv,
-        'help': '--help' in sys.argv or '-h' in sys.argv,
-        'version': '--version' in sys.argv or '-v' in sys.argv,
+        'debug': False,
+        'quiet': False,
+        'help': False,
+        'version': False,
         'config_dir': None,
-        'no_monitoring': '--no-monitoring' in sys.argv,
+        'no_monitoring': False,
         'batch_dir': None
     }
 
-    # Extract config directory if specified
-    for i, arg in enumerate(sys.argv):
-        if arg == '--config-dir' and i + 1 < len(sys.argv):
-            args['config_dir'] = sys.argv[i + 1]
+    argv = iter(sys.argv[1:])
+    for arg in argv:
+        if arg in _BOOL_FLAGS:
+            args[_BOOL_FLAGS[arg]] = True
+        elif arg == '--config-dir':
+            args['config_dir'] = next(argv, None)
         elif arg.startswith('--config-dir='):
             args['config_dir'] = arg.split('=', 1)[1]
-        elif not arg.startswith('--') and i > 0 and not sys.argv[i - 1].startswith('--'):
+        elif not arg.startswith('--'):
             # Assume it's a batch directory
             args['batch_dir'] = arg
 
@@ -280,7 +319,7 @@ Copyright (c) 2024 Scanner Extension Project
     print(version_text)
 
 
-def setup_application_style(app: QApplication) -> None:
+def setup_application_style(app: 'QApplication') -> None:
     """
     Configure application-wide styling and appearance.
 
@@ -288,6 +327,9 @@ def setup_application_style(app: QApplication) -> None:
         app: QApplication instance
     """
     try:
+        from PySide6.QtCore import Qt, QTimer
+        from PySide6.QtGui import QFont
+
         # Set application properties
         app.setApplicationDisplayName("Scanner Extension")
         app.setApplicationName("ScannerExtension")
@@ -308,25 +350,43 @@ def setup_application_style(app: QApplication) -> None:
         app.setAttribute(Qt.AA_EnableHighDpiScaling, True)
         app.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
 
+        # Load the icon and stylesheet once the event loop is running so the
+        # disk reads don't delay the main window
+        QTimer.singleShot(0, lambda: apply_application_resources(app))
+
+        logging.info("Application styling configured")
+
+    except Exception as e:
+        logging.warning(f"Failed to configure application styling: {e}")
+
+
+def apply_application_resources(app: 'QApplication') -> None:
+    """
+    Apply the optional window icon and custom stylesheet.
+
+    Args:
+        app: QApplication instance
+    """
+    try:
+        from PySide6.QtGui import QIcon
+
         # Set window icon if available
-        icon_path = Path(__file__).parent / "resources" / "icons" / "app_icon.png"
+        icon_path = APP_DIR / "resources" / "icons" / "app_icon.png"
         if icon_path.exists():
             app.setWindowIcon(QIcon(str(icon_path)))
 
         # Apply custom stylesheet if available
-        style_path = Path(__file__).parent / "resources" / "styles" / "main.qss"
-        if style_path.exists():
-            try:
-                with open(style_path, 'r', encoding='utf-8') as f:
-                    app.setStyleSheet(f.read())
-                logging.info("Custom stylesheet applied")
-            except Exception as e:
-                logging.warning(f"Failed to apply custom stylesheet: {e}")
-
-        logging.info("Application styling configured")
+        style_path = APP_DIR / "resources" / "styles" / "main.qss"
+        try:
+            app.setStyleSheet(style_path.read_text(encoding='utf-8'))
+            logging.info("Custom stylesheet applied")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.warning(f"Failed to apply custom stylesheet: {e}")
 
     except Exception as e:
-        logging.warning(f"Failed to configure application styling: {e}")
+        logging.warning(f"Failed to apply application resources: {e}")
 
 
 def main() -> int:
@@ -350,7 +410,7 @@ def main() -> int:
             return 0
 
         # Setup logging early
-        setup_logging()
+        setup_logging(args)
 
         # Install global exception handler
         sys.excepthook = handle_exceptions
@@ -361,9 +421,10 @@ def main() -> int:
         missing_deps = check_dependencies()
         if missing_deps:
             error_msg = "Missing required dependencies"
+            bullets = "\n".join(f"• {dep}" for dep in missing_deps)
             details = (
                 f"The following packages are required but not found:\n\n"
-                f"{chr(10).join('• ' + dep for dep in missing_deps)}\n\n"
+                f"{bullets}\n\n"
                 f"Please install them using pip:\n"
                 f"pip install {' '.join(missing_deps)}"
             )
@@ -377,7 +438,15 @@ def main() -> int:
         # Create QApplication with proper arguments
         # Filter out our custom arguments that Qt doesn't understand
         qt_args = [arg for arg in sys.argv if not arg.startswith('--') or
-                   arg in ['--help', '--version']]
+                   arg in _QT_PASSTHROUGH_ARGS]
+
+        try:
+            from PySide6.QtCore import QTimer
+            from src.core.application import ScannerExtensionApp
+        except ImportError as e:
+            print(f"Error: PySide6 not found. Please install it with: pip install PySide6")
+            print(f"Import error: {e}")
+            return 1
 
         app = ScannerExtensionApp(qt_args)
 
@@ -416,7 +485,12 @@ def main() -> int:
         # Load initial batch if specified
         if args['batch_dir']:
             batch_path = Path(args['batch_dir'])
-            if batch_path.exists() and batch_path.is_dir():
+            try:
+                is_batch_dir = stat.S_ISDIR(os.stat(batch_path).st_mode)
+            except OSError:
+                is_batch_dir = False
+
+            if is_batch_dir:
                 logging.info(f"Loading initial batch from: {batch_path}")
                 # Signal to load the batch (this will be handled by the main window)
                 QTimer.singleShot(500, lambda: app.main_window.batch_load_requested.emit(str(batch_path)))
@@ -460,17 +534,6 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    # Ensure proper cleanup on exit
-    import atexit
-
-
-    def cleanup():
-        """Cleanup function called on exit."""
-        logging.info("Application cleanup completed")
-
-
-    atexit.register(cleanup)
-
     # Run the application
     exit_code = main()
-    sys.exit(exit_code)
\ No newline at end of file
+    sys.exit(exit_code)
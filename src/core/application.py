@@ -7,15 +7,40 @@ application-wide state, and coordinates the overall application lifecycle.
 
 import sys
 import logging
+import functools
+import importlib.util
 from pathlib import Path
 from typing import Optional, Dict, Any
 
 from PySide6.QtWidgets import QApplication, QMessageBox
-from PySide6.QtCore import QTimer, QStandardPaths
-from PySide6.QtGui import QIcon
+from PySide6.QtCore import QStandardPaths
 
 from .signals import app_signals
 from .exceptions import ScannerExtensionError, ConfigurationError
+from ..utils.logging_utils import create_buffered_file_handler, end_startup_buffering
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_import(module_path: str, name: str) -> Any:
+    """
+    Import a name from a module, caching the lookup.
+
+    Args:
+        module_path: Module path, relative paths resolve against this package
+        name: Attribute to fetch from the module
+
+    Returns:
+        Any: The imported attribute
+    """
+    module_name = importlib.util.resolve_name(module_path, __package__)
+    module = sys.modules.get(module_name) or importlib.import_module(module_name)
+    return getattr(module, name)
+
+
+@functools.lru_cache(maxsize=None)
+def _writable_location(location: QStandardPaths.StandardLocation) -> str:
+    """Look up a standard writable location once per process."""
+    return QStandardPaths.writableLocation(location)
 
 
 class ScannerExtensionApp(QApplication):
@@ -26,6 +51,9 @@ class ScannerExtensionApp(QApplication):
     and application shutdown procedures.
     """
 
+    # Components stored as attributes, in cleanup order
+    CORE_COMPONENTS = ('config_manager', 'schema_manager', 'cache_manager', 'main_window')
+
     def __init__(self, argv):
         super().__init__(argv)
 
@@ -33,17 +61,14 @@ class ScannerExtensionApp(QApplication):
         self.main_window: Optional['MainWindow'] = None
         self.config_manager: Optional['ConfigurationManager'] = None
         self.schema_manager: Optional['SchemaManager'] = None
-
-        # Directory paths
-        self._temp_directory: Optional[Path] = None
-        self._config_directory: Optional[Path] = None
-        self._user_data_directory: Optional[Path] = None
+        self.cache_manager: Optional['CacheManager'] = None
 
         # Application state
         self._is_initialized = False
         self._shutdown_in_progress = False
 
-        # Component registry
+        # Registry for additional components; core components live on
+        # the attributes named in CORE_COMPONENTS
         self._components: Dict[str, Any] = {}
 
         # Setup basic application properties
@@ -53,10 +78,7 @@ class ScannerExtensionApp(QApplication):
         self.setApplicationDisplayName("NAPS2 Scanner Extension")
 
         # Initialize logging
-        self._setup_logging()
-
-        # Set up exception handling
-        sys.excepthook = self._handle_exception
+        self._setup_logging(argv)
 
         # Connect application signals
         self.aboutToQuit.connect(self._handle_shutdown)
@@ -104,13 +126,13 @@ class ScannerExtensionApp(QApplication):
 
     def _ensure_directories(self):
         """Create necessary application directories."""
-        directories = [
-            self.get_temp_directory(),
-            self.get_config_directory(),
-            self.get_user_data_directory(),
-            self.get_temp_directory() / "thumbnails",
-            self.get_temp_directory() / "staging"
-        ]
+        # Leaf directories only; mkdir(parents=True) creates the temp root
+        directories = (
+            self.temp_directory / "thumbnails",
+            self.temp_directory / "staging",
+            self.config_directory,
+            self.user_data_directory,
+        )
 
         for directory in directories:
             try:
@@ -123,13 +145,12 @@ class ScannerExtensionApp(QApplication):
         """Initialize configuration management."""
         try:
             # Import here to avoid circular imports
-            from ..utils.config import ConfigurationManager
+            ConfigurationManager = _cached_import("..utils.config", "ConfigurationManager")
 
-            config_file = self.get_config_directory() / "app_config.json"
+            config_file = self.config_directory / "app_config.json"
             self.config_manager = ConfigurationManager(config_file)
             self.config_manager.load_application_config()
 
-            self._components['config_manager'] = self.config_manager
             logging.info("Configuration manager initialized")
 
         except Exception as e:
@@ -139,13 +160,12 @@ class ScannerExtensionApp(QApplication):
         """Initialize schema management system."""
         try:
             # Import here to avoid circular imports
-            from ..utils.schema_manager import SchemaManager
+            SchemaManager = _cached_import("..utils.schema_manager", "SchemaManager")
 
-            schemas_dir = self.get_config_directory() / "schemas"
+            schemas_dir = self.config_directory / "schemas"
             schemas_dir.mkdir(exist_ok=True)
 
             self.schema_manager = SchemaManager(schemas_dir)
-            self._components['schema_manager'] = self.schema_manager
 
             logging.info("Schema manager initialized")
 
@@ -156,13 +176,12 @@ class ScannerExtensionApp(QApplication):
         """Initialize application cache system."""
         try:
             # Import here to avoid circular imports
-            from ..utils.cache_manager import CacheManager
+            CacheManager = _cached_import("..utils.cache_manager", "CacheManager")
 
-            cache_dir = self.get_temp_directory() / "cache"
+            cache_dir = self.temp_directory / "cache"
             cache_size_mb = self.config_manager.get_setting("cache.max_size_mb", 500)
 
-            cache_manager = CacheManager(cache_dir, cache_size_mb)
-            self._components['cache_manager'] = cache_manager
+            self.cache_manager = CacheManager(cache_dir, cache_size_mb)
 
             logging.info("Cache system initialized")
 
@@ -185,7 +204,7 @@ class ScannerExtensionApp(QApplication):
         """Create and show the main application window."""
         try:
             # Import here to avoid circular imports
-            from ..ui.main_window import MainWindow
+            MainWindow = _cached_import("..ui.main_window", "MainWindow")
 
             self.main_window = MainWindow(self)
 
@@ -193,10 +212,13 @@ class ScannerExtensionApp(QApplication):
             self._restore_window_state()
 
             self.main_window.show()
-            self._components['main_window'] = self.main_window
 
             logging.info("Main window created and displayed")
 
+            # Startup is done; write the buffered records and stop buffering.
+            # This also covers the handler installed by main.setup_logging.
+            end_startup_buffering()
+
         except Exception as e:
             raise ScannerExtensionError(f"Failed to create main window: {e}")
 
@@ -257,7 +279,12 @@ class ScannerExtensionApp(QApplication):
 
     def _cleanup_components(self):
         """Clean up all application components."""
-        for name, component in self._components.items():
+        components = [(name, getattr(self, name)) for name in self.CORE_COMPONENTS]
+        components.extend(self._components.items())
+
+        for name, component in components:
+            if component is None:
+                continue
             try:
                 if hasattr(component, 'cleanup'):
                     component.cleanup()
@@ -265,42 +292,35 @@ class ScannerExtensionApp(QApplication):
             except Exception as e:
                 logging.warning(f"Error cleaning up {name}: {e}")
 
-    def _setup_logging(self):
-        """Configure application logging."""
+    def _setup_logging(self, argv):
+        """Configure application logging unless the entry point already has."""
+        if logging.getLogger().handlers:
+            logging.debug("Logging already configured, skipping application setup")
+            return
+
         log_level = logging.INFO
-        if '--debug' in sys.argv:
+        if '--debug' in argv:
             log_level = logging.DEBUG
 
         log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 
         # Create logs directory
-        log_dir = self.get_user_data_directory() / "logs"
+        log_dir = self.user_data_directory / "logs"
         log_dir.mkdir(parents=True, exist_ok=True)
 
-        # Set up file and console logging
+        # Set up file and console logging; file writes are buffered until
+        # the main window is shown, see _create_main_window
         logging.basicConfig(
             level=log_level,
             format=log_format,
             handlers=[
-                logging.FileHandler(log_dir / "scanner_extension.log"),
+                create_buffered_file_handler(
+                    log_dir / "scanner_extension.log", logging.Formatter(log_format)
+                ),
                 logging.StreamHandler(sys.stdout)
             ]
         )
 
-    def _handle_exception(self, exc_type, exc_value, exc_traceback):
-        """Global exception handler."""
-        if issubclass(exc_type, KeyboardInterrupt):
-            sys.__excepthook__(exc_type, exc_value, exc_traceback)
-            return
-
-        logging.error("Uncaught exception",
-                      exc_info=(exc_type, exc_value, exc_traceback))
-
-        # Show error dialog if GUI is available
-        if self.main_window:
-            error_msg = f"An unexpected error occurred:\n\n{exc_value}"
-            QMessageBox.critical(self.main_window, "Unexpected Error", error_msg)
-
     def _handle_error_signal(self, title: str, message: str):
         """Handle error signals by showing error dialog."""
         if self.main_window:
@@ -321,36 +341,47 @@ class ScannerExtensionApp(QApplication):
         msg_box.setStandardButtons(QMessageBox.Ok)
         msg_box.exec()
 
-    # Directory property methods
+    # Directory properties
+    @functools.cached_property
+    def temp_directory(self) -> Path:
+        """Application temporary directory."""
+        return Path(_writable_location(QStandardPaths.TempLocation)) / "scanner_extension"
+
+    @functools.cached_property
+    def config_directory(self) -> Path:
+        """Application configuration directory."""
+        return Path(_writable_location(QStandardPaths.ConfigLocation)) / "scanner_extension"
+
+    @functools.cached_property
+    def user_data_directory(self) -> Path:
+        """Application user data directory."""
+        return Path(_writable_location(QStandardPaths.AppDataLocation))
+
     def get_temp_directory(self) -> Path:
         """Get application temporary directory."""
-        if not self._temp_directory:
-            temp_path = QStandardPaths.writableLocation(QStandardPaths.TempLocation)
-            self._temp_directory = Path(temp_path) / "scanner_extension"
-        return self._temp_directory
+        return self.temp_directory
 
     def get_config_directory(self) -> Path:
         """Get application configuration directory."""
-        if not self._config_directory:
-            config_path = QStandardPaths.writableLocation(QStandardPaths.ConfigLocation)
-            self._config_directory = Path(config_path) / "scanner_extension"
-        return self._config_directory
+        return self.config_directory
 
     def get_user_data_directory(self) -> Path:
         """Get application user data directory."""
-        if not self._user_data_directory:
-            data_path = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
-            self._user_data_directory = Path(data_path)
-        return self._user_data_directory
+        return self.user_data_directory
 
     # Component access methods
     def get_component(self, name: str) -> Optional[Any]:
         """Get a registered component by name."""
+        if name in self.CORE_COMPONENTS:
+            return getattr(self, name)
         return self._components.get(name)
 
     def register_component(self, name: str, component: Any):
         """Register a component for global access."""
-        self._components[name] = component
+        if name in self.CORE_COMPONENTS:
+            setattr(self, name, component)
+        else:
+            self._components[name] = component
         logging.debug(f"Registered component: {name}")
 
     # Application state methods
@@ -5,8 +5,9 @@ This module provides a single source of truth for all application signals,
 enabling loose coupling between UI components and business logic.
 """
 
+import time
 from PySide6.QtCore import QObject, Signal
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict
 
 if TYPE_CHECKING:
     from ..models.batch import DocumentBatch
@@ -15,6 +16,10 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 
+# Minimum interval between emissions of a rate-limited progress signal
+PROGRESS_EMIT_INTERVAL_NS = 33_000_000  # ~30 Hz
+
+
 class ApplicationSignals(QObject):
     """Central hub for all application signals."""
 
@@ -107,6 +112,21 @@ class ApplicationSignals(QObject):
     def __init__(self, parent=None):
         super().__init__(parent)
 
+        # Names of all declared signals, collected once from the class
+        cls = type(self)
+        self._signal_names = frozenset(
+            name for name in dir(cls) if isinstance(getattr(cls, name, None), Signal)
+        )
+
+        # Last emission time per rate-limited signal
+        self._last_emit_ns: Dict[str, int] = {}
+
+        # Bound emitters for the convenience methods below
+        self._emit_status = self.status_message.emit
+        self._emit_error = self.error_occurred.emit
+        self._emit_warning = self.warning_occurred.emit
+        self._emit_info = self.info_message.emit
+
     def connect_all_signals(self, receiver_dict):
         """
         Connect multiple signals at once using a dictionary mapping.
@@ -116,34 +136,65 @@ class ApplicationSignals(QObject):
                           e.g., {'batch_loaded': self.handle_batch_loaded}
         """
         for signal_name, receiver in receiver_dict.items():
-            if hasattr(self, signal_name):
-                signal = getattr(self, signal_name)
-                signal.connect(receiver)
+            if signal_name in self._signal_names:
+                getattr(self, signal_name).connect(receiver)
             else:
                 print(f"Warning: Signal '{signal_name}' not found")
 
     def disconnect_all_signals(self):
         """Disconnect all signals - useful for cleanup."""
-        for attr_name in dir(self):
-            attr = getattr(self, attr_name)
-            if isinstance(attr, Signal):
-                attr.disconnect()
+        for signal_name in self._signal_names:
+            try:
+                getattr(self, signal_name).disconnect()
+            except (TypeError, RuntimeError):
+                # Signal had no connections
+                pass
 
     def emit_status(self, message: str, timeout: int = 3000):
         """Convenience method to emit status messages."""
-        self.status_message.emit(message, timeout)
+        self._emit_status(message, timeout)
 
     def emit_error(self, title: str, message: str):
         """Convenience method to emit error messages."""
-        self.error_occurred.emit(title, message)
+        self._emit_error(title, message)
 
     def emit_warning(self, title: str, message: str):
         """Convenience method to emit warning messages."""
-        self.warning_occurred.emit(title, message)
+        self._emit_warning(title, message)
 
     def emit_info(self, title: str, message: str):
         """Convenience method to emit info messages."""
-        self.info_message.emit(title, message)
+        self._emit_info(title, message)
+
+    def emit_processing_progress(self, progress: int, message: str):
+        """Emit processing progress, rate limited to ~30 updates per second."""
+        self._rate_limited_emit('processing_progress', progress >= 100, progress, message)
+
+    def emit_export_progress(self, progress: int, current_file: str):
+        """Emit export progress, rate limited to ~30 updates per second."""
+        self._rate_limited_emit('export_progress', progress >= 100, progress, current_file)
+
+    def emit_progress_update(self, progress: int, message: str):
+        """Emit a general progress update, rate limited to ~30 updates per second."""
+        self._rate_limited_emit('progress_update', progress >= 100, progress, message)
+
+    def emit_thumbnail_progress(self, current: int, total: int):
+        """Emit thumbnail generation progress, rate limited to ~30 updates per second."""
+        self._rate_limited_emit('thumbnail_generation_progress', current >= total, current, total)
+
+    def _rate_limited_emit(self, signal_name: str, is_final: bool, *args):
+        """
+        Emit a signal unless it was emitted within PROGRESS_EMIT_INTERVAL_NS.
+
+        Final values are always emitted so receivers see completion.
+        """
+        now = time.monotonic_ns()
+        last = self._last_emit_ns.get(signal_name)
+        if not is_final and last is not None and now - last < PROGRESS_EMIT_INTERVAL_NS:
+            return
+
+        self._last_emit_ns[signal_name] = now
+        getattr(self, signal_name).emit(*args)
 
 
 # Global signals instance - imported by other modules
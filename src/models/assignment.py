@@ -5,11 +5,16 @@ Handles the linking of specific PDF pages to index values and
 manages the document creation assignments.
 """
 
+import os
+import sys
+import time
 import uuid
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Any, Set, Tuple
-from dataclasses import dataclass
+from typing import List, Dict, Optional, Any, Set, Tuple, KeysView, Callable
+from dataclasses import dataclass, field
+from contextlib import contextmanager
 
 from .schema import IndexSchema
 from .enums import ValidationSeverity
@@ -25,15 +30,14 @@ class PageReference:
     """
     file_id: str
     page_number: int  # 1-based page numbering
+    page_id: str = field(init=False, repr=False, compare=False)  # "file_id:page_number"
 
     def __post_init__(self):
         if self.page_number < 1:
             raise ValueError("Page number must be 1 or greater")
-
-    @property
-    def page_id(self) -> str:
-        """Get unique identifier for this page."""
-        return f"{self.file_id}:{self.page_number}"
+        # Pages of one file share a single file_id string object
+        object.__setattr__(self, 'file_id', sys.intern(self.file_id))
+        object.__setattr__(self, 'page_id', f"{self.file_id}:{self.page_number}")
 
     def get_unique_id(self) -> str:
         """Generate unique identifier for this page reference."""
@@ -49,20 +53,63 @@ class PageReference:
 class DocumentPreview:
     """Preview information for document generation."""
 
+    __slots__ = (
+        '_filename', '_folder_path', '_full_path', '_full_path_str',
+        'page_references', 'page_count', 'estimated_file_size', 'conflicts',
+        'created_timestamp',
+    )
+
     def __init__(self, filename: str, folder_path: str, pages: List[PageReference]):
-        self.filename = filename
-        self.folder_path = folder_path
+        self._filename = filename
+        self._folder_path = folder_path
+        self._full_path: Optional[Path] = None
+        self._full_path_str: Optional[str] = None
         self.page_references = pages.copy()
         self.page_count = len(pages)
         self.estimated_file_size = 0
         self.conflicts: List[str] = []
         self.created_timestamp = datetime.now()
 
+    @property
+    def filename(self) -> str:
+        """Output filename without extension."""
+        return self._filename
+
+    @filename.setter
+    def filename(self, value: str):
+        self._filename = value
+        self._invalidate_full_path()
+
+    @property
+    def folder_path(self) -> str:
+        """Output folder path relative to the export root."""
+        return self._folder_path
+
+    @folder_path.setter
+    def folder_path(self, value: str):
+        self._folder_path = value
+        self._invalidate_full_path()
+
+    def _invalidate_full_path(self):
+        """Drop cached full path after filename or folder changes."""
+        self._full_path = None
+        self._full_path_str = None
+
     def get_full_path(self) -> Path:
         """Get complete file path including folder and filename."""
-        if self.folder_path:
-            return Path(self.folder_path) / f"{self.filename}.pdf"
-        return Path(f"{self.filename}.pdf")
+        if self._full_path is None:
+            self._full_path = Path(self.get_full_path_str())
+        return self._full_path
+
+    def get_full_path_str(self) -> str:
+        """Get complete file path as a string, without building a Path."""
+        if self._full_path_str is None:
+            file_name = f"{self._filename}.pdf"
+            if self._folder_path:
+                self._full_path_str = os.path.join(self._folder_path, file_name)
+            else:
+                self._full_path_str = file_name
+        return self._full_path_str
 
     def calculate_estimated_size(self, avg_page_size: int = 50000) -> int:
         """
@@ -105,7 +152,7 @@ class DocumentPreview:
                     errors.append(f"Folder name '{part}' uses reserved system name")
 
         # Check total path length
-        full_path = str(self.get_full_path())
+        full_path = self.get_full_path_str()
         if len(full_path) > AppConstants.MAX_PATH_LENGTH:
             errors.append(f"Complete path is too long ({len(full_path)} > {AppConstants.MAX_PATH_LENGTH})")
 
@@ -123,9 +170,21 @@ class PageAssignment:
     which will result in a single output document.
     """
 
+    __slots__ = (
+        'assignment_id', '_hash', 'page_references', '_page_ids', '_pages_by_file',
+        'index_values', 'schema',
+        'output_filename', 'output_folder_path', 'document_preview',
+        'is_valid', 'validation_errors', 'validation_warnings',
+        'created_timestamp', '_modified_time', '_revision',
+        '_batch_depth', '_batch_dirty', '_pages_observer',
+    )
+
     def __init__(self, assignment_id: Optional[str] = None, schema: Optional[IndexSchema] = None):
         self.assignment_id = assignment_id or str(uuid.uuid4())
+        self._hash = hash(self.assignment_id)  # assignment_id never changes
         self.page_references: List[PageReference] = []
+        self._page_ids: Dict[str, None] = {}  # page_ids of page_references, as keys
+        self._pages_by_file: Dict[str, List[PageReference]] = {}  # file_id -> pages
         self.index_values: Dict[str, str] = {}
         self.schema = schema
 
@@ -139,55 +198,149 @@ class PageAssignment:
         self.validation_errors: List[str] = []
         self.validation_warnings: List[str] = []
 
-        # Timestamps
+        # Timestamps; modification time is kept as a float and only turned
+        # into a datetime when read
         self.created_timestamp = datetime.now()
-        self.modified_timestamp = datetime.now()
+        self._modified_time = self.created_timestamp.timestamp()
+        self._revision = 0  # incremented on every recorded modification
+
+        # Deferred modification tracking for batch_update()
+        self._batch_depth = 0
+        self._batch_dirty = False
+
+        # Notified with (assignment, added, removed) when pages change
+        self._pages_observer: Optional[
+            Callable[['PageAssignment', List[PageReference], List[PageReference]], None]
+        ] = None
+
+    @property
+    def modified_timestamp(self) -> datetime:
+        """Time of the last recorded modification."""
+        return datetime.fromtimestamp(self._modified_time)
+
+    @modified_timestamp.setter
+    def modified_timestamp(self, value: datetime):
+        self._modified_time = value.timestamp()
+
+    @property
+    def revision(self) -> int:
+        """Modification counter; compare values to detect changes."""
+        return self._revision
+
+    def set_pages_observer(self, observer: Optional[
+            Callable[['PageAssignment', List[PageReference], List[PageReference]], None]]):
+        """
+        Set a callback invoked with (assignment, added, removed) on page changes.
+
+        Args:
+            observer: Callback, or None to remove the current one
+        """
+        self._pages_observer = observer
+
+    def _notify_pages_changed(self, added: List[PageReference], removed: List[PageReference]):
+        """Report added and removed pages to the observer, if any."""
+        if self._pages_observer:
+            self._pages_observer(self, added, removed)
+
+    @contextmanager
+    def batch_update(self):
+        """
+        Group several modifications into one.
+
+        The modified timestamp and preview invalidation are applied once
+        when the outermost batch exits, instead of after every change.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_dirty:
+                self._batch_dirty = False
+                self._mark_modified()
+
+    def _mark_modified(self):
+        """Record a modification, deferring it while a batch update is open."""
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
+        self._revision += 1
+        self._modified_time = time.time()
+        self._invalidate_preview()
 
     def add_page(self, page_reference: PageReference):
         """Add a page to this assignment."""
-        if page_reference not in self.page_references:
-            self.page_references.append(page_reference)
-            self.modified_timestamp = datetime.now()
-            self._invalidate_preview()
+        if self._append_page(page_reference):
+            self._mark_modified()
+            self._notify_pages_changed([page_reference], [])
 
     def add_pages(self, page_references: List[PageReference]):
         """Add multiple pages to this assignment."""
-        for page_ref in page_references:
-            if page_ref not in self.page_references:
-                self.page_references.append(page_ref)
+        added = [page_ref for page_ref in page_references if self._append_page(page_ref)]
 
-        if page_references:  # Only update timestamp if we actually added pages
-            self.modified_timestamp = datetime.now()
-            self._invalidate_preview()
+        if added:  # Only update timestamp if we actually added pages
+            self._mark_modified()
+            self._notify_pages_changed(added, [])
 
     def remove_page(self, page_reference: PageReference) -> bool:
         """Remove a page from this assignment. Returns True if found and removed."""
-        try:
-            self.page_references.remove(page_reference)
-            self.modified_timestamp = datetime.now()
-            self._invalidate_preview()
-            return True
-        except ValueError:
+        page_id = page_reference.page_id
+        if page_id not in self._page_ids:
             return False
 
+        del self._page_ids[page_id]
+        self.page_references.remove(page_reference)
+
+        file_pages = self._pages_by_file[page_reference.file_id]
+        file_pages.remove(page_reference)
+        if not file_pages:
+            del self._pages_by_file[page_reference.file_id]
+
+        self._mark_modified()
+        self._notify_pages_changed([], [page_reference])
+        return True
+
+    def remove_pages_from_file(self, file_id: str) -> List[PageReference]:
+        """
+        Remove every page that belongs to a file.
+
+        page_references stays a list because output page order matters, so
+        removing one page is O(n). Removing a whole file rebuilds the list
+        once instead of calling remove_page for each of its pages.
+
+        Returns:
+            The removed page references
+        """
+        removed = self._pages_by_file.pop(file_id, None)
+        if not removed:
+            return []
+
+        for ref in removed:
+            del self._page_ids[ref.page_id]
+        self.page_references = [ref for ref in self.page_references if ref.file_id != file_id]
+        self._mark_modified()
+        self._notify_pages_changed([], removed)
+        return removed
+
     def clear_pages(self):
         """Remove all page assignments."""
         if self.page_references:
+            removed = list(self.page_references)
             self.page_references.clear()
-            self.modified_timestamp = datetime.now()
-            self._invalidate_preview()
+            self._page_ids.clear()
+            self._pages_by_file.clear()
+            self._mark_modified()
+            self._notify_pages_changed([], removed)
 
     def update_index_values(self, values: Dict[str, str]):
         """Update all index values at once."""
         self.index_values.update(values)
-        self.modified_timestamp = datetime.now()
-        self._invalidate_preview()
+        self._mark_modified()
 
     def set_index_value(self, field_name: str, value: str):
         """Set a specific field value."""
         self.index_values[field_name] = value
-        self.modified_timestamp = datetime.now()
-        self._invalidate_preview()
+        self._mark_modified()
 
     def get_index_value(self, field_name: str) -> Optional[str]:
         """Get a specific field value."""
@@ -203,11 +356,38 @@ class PageAssignment:
 
     def get_file_ids(self) -> Set[str]:
         """Get set of unique file IDs referenced by this assignment."""
-        return {ref.file_id for ref in self.page_references}
+        return set(self._pages_by_file)
+
+    def file_ids(self) -> KeysView[str]:
+        """Read-only view of the file IDs referenced by this assignment."""
+        return self._pages_by_file.keys()
+
+    def page_ids(self) -> KeysView[str]:
+        """Read-only view of the page IDs of all pages in this assignment."""
+        return self._page_ids.keys()
+
+    def get_file_count(self) -> int:
+        """Get the number of unique files referenced by this assignment."""
+        return len(self._pages_by_file)
+
+    def contains_file(self, file_id: str) -> bool:
+        """Check if this assignment has pages from a specific file."""
+        return file_id in self._pages_by_file
 
     def get_pages_from_file(self, file_id: str) -> List[PageReference]:
         """Get all page references from a specific file."""
-        return [ref for ref in self.page_references if ref.file_id == file_id]
+        return list(self._pages_by_file.get(file_id, ()))
+
+    def _append_page(self, page_reference: PageReference) -> bool:
+        """Append a page and index it. Returns False if already present."""
+        page_id = page_reference.page_id
+        if page_id in self._page_ids:
+            return False
+
+        self._page_ids[page_id] = None
+        self.page_references.append(page_reference)
+        self._pages_by_file.setdefault(page_reference.file_id, []).append(page_reference)
+        return True
 
     def validate_assignment(self) -> Tuple[bool, List[str], List[str]]:
         """
@@ -233,26 +413,35 @@ class PageAssignment:
         errors.extend(schema_errors)
 
         # Check for missing required fields
-        for field in self.schema.get_required_fields():
-            value = self.index_values.get(field.name, "").strip()
-            if not value:
-                errors.append(f"Required field '{field.name}' is missing")
-
-        # Generate preview to check for path issues
-        try:
-            preview = self.generate_document_preview()
-            path_valid, path_errors = preview.validate_paths()
-            if not path_valid:
-                errors.extend(path_errors)
-        except Exception as e:
-            errors.append(f"Cannot generate document preview: {e}")
+        filled = {name for name, value in self.index_values.items() if value and value.strip()}
+        missing = self.schema.required_field_names - filled
+        if missing:
+            errors.extend(
+                f"Required field '{field.name}' is missing"
+                for field in self.schema.get_required_fields()
+                if field.name in missing
+            )
+
+        # Generate preview to check for path issues (the schema was checked
+        # above; an assignment without pages has no output to preview)
+        if self.page_references:
+            try:
+                preview = self.generate_document_preview()
+                path_valid, path_errors = preview.validate_paths()
+                if not path_valid:
+                    errors.extend(path_errors)
+            except (ValueError, IndexError, KeyError, AttributeError, TypeError) as e:
+                # Malformed filename template in the schema, e.g. "{}",
+                # "{timestamp.x}" or "{timestamp[x]}"
+                errors.append(f"Cannot generate document preview: {e}")
 
         # Warnings for potential issues
         if self.get_page_count() > 100:
             warnings.append(f"Large document ({self.get_page_count()} pages) may be slow to process")
 
-        if len(self.get_file_ids()) > 10:
-            warnings.append(f"Pages from many files ({len(self.get_file_ids())}) may affect performance")
+        file_count = self.get_file_count()
+        if file_count > 10:
+            warnings.append(f"Pages from many files ({file_count}) may affect performance")
 
         # Update state
         self.is_valid = len(errors) == 0
@@ -294,7 +483,7 @@ class PageAssignment:
         return {
             'assignment_id': self.assignment_id,
             'page_count': self.get_page_count(),
-            'file_count': len(self.get_file_ids()),
+            'file_count': self.get_file_count(),
             'field_count': len(self.index_values),
             'is_valid': self.is_valid,
             'error_count': len(self.validation_errors),
@@ -309,7 +498,7 @@ class PageAssignment:
         return {
             'assignment_id': self.assignment_id,
             'page_references': [
-                {'file_id': ref.file_id, 'page_number': ref.page_number}
+                [ref.file_id, ref.page_number]  # compact [file_id, page_number] pairs
                 for ref in self.page_references
             ],
             'index_values': self.index_values.copy(),
@@ -328,8 +517,13 @@ class PageAssignment:
 
         # Load page references
         for page_data in data.get('page_references', []):
-            ref = PageReference(page_data['file_id'], page_data['page_number'])
-            assignment.page_references.append(ref)
+            if isinstance(page_data, dict):
+                # Older format with one dict per page
+                ref = PageReference(page_data['file_id'], page_data['page_number'])
+            else:
+                file_id, page_number = page_data
+                ref = PageReference(file_id, page_number)
+            assignment._append_page(ref)
 
         # Load index values
         assignment.index_values = data.get('index_values', {}).copy()
@@ -351,13 +545,14 @@ class PageAssignment:
     def clone(self) -> 'PageAssignment':
         """Create a copy of this assignment with a new ID."""
         new_assignment = PageAssignment(schema=self.schema)
-        new_assignment.page_references = self.page_references.copy()
+        for page_ref in self.page_references:
+            new_assignment._append_page(page_ref)
         new_assignment.index_values = self.index_values.copy()
         return new_assignment
 
     def __str__(self) -> str:
         page_count = self.get_page_count()
-        file_count = len(self.get_file_ids())
+        file_count = self.get_file_count()
         return f"PageAssignment({page_count} pages from {file_count} files)"
 
     def __repr__(self) -> str:
@@ -370,31 +565,40 @@ class PageAssignment:
         return self.assignment_id == other.assignment_id
 
     def __hash__(self) -> int:
-        return hash(self.assignment_id)
+        return self._hash
 
 
 class AssignmentManager:
     """
     Manages collections of page assignments and handles conflicts.
+
+    Managed assignments report page changes back to the manager, so the page
+    and file mappings stay current when pages are added to or removed from
+    an assignment directly.
     """
 
     def __init__(self):
         self.assignments: Dict[str, PageAssignment] = {}
         self._page_to_assignment: Dict[str, str] = {}  # page_id -> assignment_id
+        self._file_to_assignments: Dict[str, Set[str]] = defaultdict(set)  # file_id -> assignment_ids
 
     def add_assignment(self, assignment: PageAssignment):
         """Add an assignment to the manager."""
         self.assignments[assignment.assignment_id] = assignment
         self._update_page_mapping(assignment)
+        assignment.set_pages_observer(self._on_assignment_pages_changed)
 
     def remove_assignment(self, assignment_id: str) -> bool:
         """Remove an assignment. Returns True if found and removed."""
         if assignment_id in self.assignments:
             assignment = self.assignments[assignment_id]
+            assignment.set_pages_observer(None)
 
-            # Remove from page mapping
+            # Remove from page and file mappings
             for page_ref in assignment.page_references:
                 self._page_to_assignment.pop(page_ref.page_id, None)
+            for file_id in assignment.file_ids():
+                self._discard_file_assignment(file_id, assignment_id)
 
             del self.assignments[assignment_id]
             return True
@@ -409,17 +613,50 @@ class AssignmentManager:
         assignment_id = self._page_to_assignment.get(page_reference.page_id)
         return self.assignments.get(assignment_id) if assignment_id else None
 
+    def get_assignments_for_file(self, file_id: str) -> List[PageAssignment]:
+        """Get all assignments that contain pages from a specific file."""
+        assignment_ids = self._file_to_assignments.get(file_id, ())
+        return [self.assignments[assignment_id] for assignment_id in assignment_ids]
+
+    def remove_file_pages(self, file_id: str) -> List[str]:
+        """
+        Remove a file's pages from every assignment that contains them.
+
+        Args:
+            file_id: ID of the file whose pages should be removed
+
+        Returns:
+            List of IDs of assignments left without any pages
+        """
+        emptied_assignments = []
+        # The mappings are updated through _on_assignment_pages_changed
+        for assignment_id in list(self._file_to_assignments.get(file_id, ())):
+            assignment = self.assignments[assignment_id]
+            assignment.remove_pages_from_file(file_id)
+            if not assignment.has_pages():
+                emptied_assignments.append(assignment_id)
+        return emptied_assignments
+
     def check_page_conflicts(self, page_references: List[PageReference]) -> List[PageReference]:
         """Check which pages are already assigned to other assignments."""
-        conflicts = []
-        for page_ref in page_references:
-            if page_ref.page_id in self._page_to_assignment:
-                conflicts.append(page_ref)
-        return conflicts
+        refs_by_id = {page_ref.page_id: page_ref for page_ref in page_references}
+        conflicted_ids = self._page_to_assignment.keys() & refs_by_id.keys()
+        if not conflicted_ids:
+            return []
+        return [page_ref for page_id, page_ref in refs_by_id.items() if page_id in conflicted_ids]
 
     def get_unassigned_pages(self, all_pages: List[PageReference]) -> List[PageReference]:
         """Get pages that are not assigned to any assignment."""
-        return [page for page in all_pages if page.page_id not in self._page_to_assignment]
+        assigned_ids = self._page_to_assignment.keys()
+        return [page for page in all_pages if page.page_id not in assigned_ids]
+
+    def assigned_page_ids(self) -> KeysView[str]:
+        """Get a live, read-only view of the IDs of all assigned pages."""
+        return self._page_to_assignment.keys()
+
+    def assigned_page_count(self) -> int:
+        """Get the number of pages assigned to any assignment."""
+        return len(self._page_to_assignment)
 
     def validate_all_assignments(self) -> Dict[str, Tuple[bool, List[str], List[str]]]:
         """
@@ -441,41 +678,72 @@ class AssignmentManager:
         Returns:
             List of (assignment_id1, assignment_id2, conflicting_path) tuples
         """
-        conflicts = []
-        path_to_assignments = {}
-
+        path_to_assignments: Dict[str, List[str]] = defaultdict(list)
         for assignment in self.assignments.values():
             if assignment.document_preview:
-                full_path = str(assignment.document_preview.get_full_path())
-                if full_path in path_to_assignments:
-                    # Conflict found
-                    existing_id = path_to_assignments[full_path]
-                    conflicts.append((existing_id, assignment.assignment_id, full_path))
-                else:
-                    path_to_assignments[full_path] = assignment.assignment_id
+                full_path = assignment.document_preview.get_full_path_str()
+                path_to_assignments[full_path].append(assignment.assignment_id)
 
-        return conflicts
+        # Each later assignment conflicts with the first one claiming the path
+        return [
+            (assignment_ids[0], other_id, full_path)
+            for full_path, assignment_ids in path_to_assignments.items()
+            if len(assignment_ids) > 1
+            for other_id in assignment_ids[1:]
+        ]
 
     def _update_page_mapping(self, assignment: PageAssignment):
         """Update the page-to-assignment mapping."""
-        for page_ref in assignment.page_references:
-            self._page_to_assignment[page_ref.page_id] = assignment.assignment_id
+        self._page_to_assignment.update(
+            dict.fromkeys(assignment.page_ids(), assignment.assignment_id)
+        )
+        for file_id in assignment.file_ids():
+            self._file_to_assignments[file_id].add(assignment.assignment_id)
+
+    def _on_assignment_pages_changed(self, assignment: PageAssignment,
+                                     added: List[PageReference], removed: List[PageReference]):
+        """Apply a managed assignment's page changes to the mappings."""
+        assignment_id = assignment.assignment_id
+        for page_ref in added:
+            self._page_to_assignment[page_ref.page_id] = assignment_id
+            self._file_to_assignments[page_ref.file_id].add(assignment_id)
+        for page_ref in removed:
+            if self._page_to_assignment.get(page_ref.page_id) == assignment_id:
+                del self._page_to_assignment[page_ref.page_id]
+            if not assignment.contains_file(page_ref.file_id):
+                self._discard_file_assignment(page_ref.file_id, assignment_id)
+
+    def _discard_file_assignment(self, file_id: str, assignment_id: str):
+        """Drop an assignment from a file's entry in the file mapping."""
+        assignment_ids = self._file_to_assignments.get(file_id)
+        if assignment_ids is not None:
+            assignment_ids.discard(assignment_id)
+            if not assignment_ids:
+                del self._file_to_assignments[file_id]
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get statistics about managed assignments."""
-        total_pages = sum(len(a.page_references) for a in self.assignments.values())
-        valid_assignments = sum(1 for a in self.assignments.values() if a.is_valid)
+        total_pages = 0
+        valid_assignments = 0
+        unique_files: Set[str] = set()
+        for assignment in self.assignments.values():
+            total_pages += len(assignment.page_references)
+            valid_assignments += assignment.is_valid
+            unique_files.update(assignment.file_ids())
 
         return {
             'total_assignments': len(self.assignments),
             'valid_assignments': valid_assignments,
             'invalid_assignments': len(self.assignments) - valid_assignments,
             'total_pages': total_pages,
-            'unique_files': len(set().union(*(a.get_file_ids() for a in self.assignments.values()))),
+            'unique_files': len(unique_files),
             'filename_conflicts': len(self.get_filename_conflicts())
         }
 
     def clear(self):
         """Remove all assignments."""
+        for assignment in self.assignments.values():
+            assignment.set_pages_observer(None)
         self.assignments.clear()
         self._page_to_assignment.clear()
+        self._file_to_assignments.clear()
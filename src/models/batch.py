@@ -5,20 +5,39 @@ Handles collections of scanned files and their page assignments,
 providing batch-level operations and validation.
 """
 
+import os
+import time
+import bisect
 import uuid
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Set, Any, Tuple
-from collections import defaultdict
+from typing import List, Dict, Optional, Set, Any, Tuple, Callable
+from collections import defaultdict, Counter
+from copy import deepcopy
+
+try:
+    import orjson  # optional, faster backup serialization
+except ImportError:
+    orjson = None
 
 from .scanned_file import ScannedFile, ScannedFileFactory
-from .assignment import PageAssignment, PageReference, AssignmentManager
+from .assignment import PageAssignment, PageReference, AssignmentManager, DocumentPreview
 from .schema import IndexSchema
 from .enums import ProcessingState, ValidationSeverity
 from ..core.exceptions import FileProcessingError, AssignmentConflictError
 
 
+# Page count distribution buckets: upper bounds and their labels
+_PAGE_RANGE_THRESHOLDS = (1, 5, 10, 25, 50)
+_PAGE_RANGE_LABELS = ("1 page", "2-5 pages", "6-10 pages", "11-25 pages", "26-50 pages", "50+ pages")
+
+
+def _path_key(file_path: Path) -> str:
+    """Key for the path lookup; strings hash much faster than Path objects."""
+    return os.fspath(file_path)
+
+
 class DocumentBatch:
     """
     Represents a collection of scanned pages and their assignments.
@@ -37,35 +56,91 @@ class DocumentBatch:
 
         # Schema and state
         self.applied_schema: Optional[IndexSchema] = None
-        self.processing_state = ProcessingState.IDLE
+        self._processing_state = ProcessingState.IDLE
+        self._state_observer: Optional[Callable[[ProcessingState, ProcessingState], None]] = None
 
-        # Timestamps and metadata
+        # Timestamps and metadata; modification time is kept as a float and
+        # only turned into a datetime when read
         self.batch_timestamp = datetime.now()
-        self.last_modified = datetime.now()
+        self._modified_time = self.batch_timestamp.timestamp()
+        self._version = 0  # incremented on every recorded modification
         self.created_by = ""
         self.description = ""
 
         # File mapping for quick lookups
         self._file_id_to_file: Dict[str, ScannedFile] = {}
-        self._file_path_to_file: Dict[Path, ScannedFile] = {}
+        self._file_path_to_file: Dict[str, ScannedFile] = {}
+        self._file_index: Dict[str, int] = {}  # file_id -> position in scanned_files
+
+        # Per-file values read by aggregates and serialization, kept in
+        # lists parallel to scanned_files
+        self._file_ids: List[str] = []
+        self._file_paths: List[str] = []
+        self._page_counts: List[int] = []
+        self._file_sizes: List[int] = []
+
+        # Running page total, maintained as files are added and removed
+        self._total_pages_counter: int = 0
 
         # Cached properties
-        self._total_pages: Optional[int] = None
+        self._all_page_refs_cache: Optional[List[PageReference]] = None
+        self._page_refs_by_file: Dict[str, List[PageReference]] = {}  # reused across rebuilds
+        # assignment_id -> (assignment revision, preview)
+        self._preview_per_assignment: Dict[str, Tuple[Tuple, DocumentPreview]] = {}
         self._validation_results: Optional[Dict[str, Any]] = None
+        self._validation_state: Optional[Tuple] = None
 
     @property
     def total_pages(self) -> int:
         """Get total number of pages across all files."""
-        if self._total_pages is None:
-            self._total_pages = sum(file.page_count for file in self.scanned_files)
-        return self._total_pages
+        return self._total_pages_counter
+
+    @property
+    def processing_state(self) -> ProcessingState:
+        """Current processing state of the batch."""
+        return self._processing_state
+
+    @processing_state.setter
+    def processing_state(self, state: ProcessingState):
+        previous_state = self._processing_state
+        self._processing_state = state
+        if self._state_observer and state is not previous_state:
+            self._state_observer(previous_state, state)
+
+    def set_state_observer(self, observer: Optional[Callable[[ProcessingState, ProcessingState], None]]):
+        """
+        Set a callback invoked with (previous_state, new_state) on state changes.
+
+        Args:
+            observer: Callback, or None to remove the current one
+        """
+        self._state_observer = observer
+
+    @property
+    def last_modified(self) -> datetime:
+        """Time of the last recorded modification."""
+        return datetime.fromtimestamp(self._modified_time)
+
+    @last_modified.setter
+    def last_modified(self, value: datetime):
+        self._modified_time = value.timestamp()
+
+    @property
+    def version(self) -> int:
+        """Modification counter; compare values to detect changes."""
+        return self._version
+
+    def _mark_modified(self):
+        """Record a modification of the batch."""
+        self._version += 1
+        self._modified_time = time.time()
 
     @property
     def unassigned_page_count(self) -> int:
         """Get number of pages not assigned to any document."""
-        all_pages = self.get_all_page_references()
-        unassigned = self.assignment_manager.get_unassigned_pages(all_pages)
-        return len(unassigned)
+        # Pages of removed files are dropped from the manager's page mapping,
+        # so every assigned page belongs to a file in this batch
+        return max(0, self.total_pages - self.assignment_manager.assigned_page_count())
 
     @property
     def assignment_count(self) -> int:
@@ -87,27 +162,12 @@ class DocumentBatch:
         Returns:
             ScannedFile instance if successful, None if failed
         """
-        # Check if file already exists
-        if file_path in self._file_path_to_file:
-            logging.warning(f"File already in batch: {file_path}")
-            return self._file_path_to_file[file_path]
-
-        # Create scanned file
-        scanned_file = ScannedFileFactory.create_from_path(file_path)
-        if not scanned_file:
-            logging.error(f"Failed to create ScannedFile for {file_path}")
-            return None
-
-        # Add to collections
-        self.scanned_files.append(scanned_file)
-        self._file_id_to_file[scanned_file.file_id] = scanned_file
-        self._file_path_to_file[file_path] = scanned_file
-
-        # Invalidate cached values
-        self._invalidate_cache()
-
-        self.last_modified = datetime.now()
-        logging.info(f"Added file to batch: {file_path} ({scanned_file.page_count} pages)")
+        file_count = len(self.scanned_files)
+        scanned_file = self._register_scanned_file(file_path)
+        if len(self.scanned_files) > file_count:
+            self._invalidate_cache()
+            self._mark_modified()
+            logging.info(f"Added file to batch: {file_path} ({scanned_file.page_count} pages)")
 
         return scanned_file
 
@@ -115,23 +175,69 @@ class DocumentBatch:
         """
         Add multiple scanned files to the batch.
 
+        Caches are invalidated and the modification time updated once for
+        the whole set rather than per file.
+
         Args:
             file_paths: List of paths to PDF files
 
         Returns:
             List of successfully added ScannedFile instances
         """
+        file_count = len(self.scanned_files)
         added_files = []
         for file_path in file_paths:
-            scanned_file = self.add_scanned_file(file_path)
+            scanned_file = self._register_scanned_file(file_path)
             if scanned_file:
                 added_files.append(scanned_file)
 
+        if len(self.scanned_files) > file_count:
+            self._invalidate_cache()
+            self._mark_modified()
+
         if added_files:
             logging.info(f"Added {len(added_files)} files to batch {self.batch_id}")
 
         return added_files
 
+    def _register_scanned_file(self, file_path: Path) -> Optional[ScannedFile]:
+        """
+        Create a scanned file and add it to the batch collections.
+
+        Leaves cache invalidation and the modification time to the caller.
+
+        Args:
+            file_path: Path to the PDF file
+
+        Returns:
+            ScannedFile instance (the existing one for duplicates), None if failed
+        """
+        # Check if file already exists
+        path_key = _path_key(file_path)
+        existing_file = self._file_path_to_file.get(path_key)
+        if existing_file is not None:
+            logging.warning(f"File already in batch: {file_path}")
+            return existing_file
+
+        # Create scanned file
+        scanned_file = ScannedFileFactory.create_from_path(file_path)
+        if not scanned_file:
+            logging.error(f"Failed to create ScannedFile for {file_path}")
+            return None
+
+        # Add to collections
+        self._file_index[scanned_file.file_id] = len(self.scanned_files)
+        self.scanned_files.append(scanned_file)
+        self._file_ids.append(scanned_file.file_id)
+        self._file_paths.append(str(scanned_file.file_path))
+        self._page_counts.append(scanned_file.page_count)
+        self._file_sizes.append(scanned_file.file_size)
+        self._file_id_to_file[scanned_file.file_id] = scanned_file
+        self._file_path_to_file[path_key] = scanned_file
+        self._total_pages_counter += scanned_file.page_count
+
+        return scanned_file
+
     def remove_file(self, file_id: str) -> bool:
         """
         Remove a file from the batch.
@@ -146,49 +252,67 @@ class DocumentBatch:
         if not scanned_file:
             return False
 
-        # Remove from all assignments first
-        assignments_to_update = []
-        for assignment in self.assignment_manager.assignments.values():
-            pages_from_file = assignment.get_pages_from_file(file_id)
-            if pages_from_file:
-                assignments_to_update.append((assignment, pages_from_file))
-
-        # Remove pages from assignments
-        for assignment, pages in assignments_to_update:
-            for page_ref in pages:
-                assignment.remove_page(page_ref)
+        # Remove pages from the assignments that reference this file first
+        emptied_assignments = self.assignment_manager.remove_file_pages(file_id)
 
-            # Remove assignment if it has no pages left
-            if not assignment.has_pages():
-                self.assignment_manager.remove_assignment(assignment.assignment_id)
+        # Remove assignments that have no pages left
+        for assignment_id in emptied_assignments:
+            self.assignment_manager.remove_assignment(assignment_id)
 
         # Remove from collections
-        self.scanned_files.remove(scanned_file)
+        index = self._file_index.pop(file_id)
+        self._total_pages_counter -= self._page_counts[index]
+        self._remove_file_at(index)
         del self._file_id_to_file[file_id]
-        del self._file_path_to_file[scanned_file.file_path]
+        self._page_refs_by_file.pop(file_id, None)
+        del self._file_path_to_file[_path_key(scanned_file.file_path)]
 
         self._invalidate_cache()
-        self.last_modified = datetime.now()
+        self._mark_modified()
 
         logging.info(f"Removed file {file_id} from batch")
         return True
 
+    def _remove_file_at(self, index: int):
+        """Delete the file at a position, keeping scan order intact."""
+        del self.scanned_files[index]
+        del self._file_ids[index]
+        del self._file_paths[index]
+        del self._page_counts[index]
+        del self._file_sizes[index]
+        for position in range(index, len(self._file_ids)):
+            self._file_index[self._file_ids[position]] = position
+
     def get_file_by_id(self, file_id: str) -> Optional[ScannedFile]:
         """Get a scanned file by its ID."""
         return self._file_id_to_file.get(file_id)
 
     def get_file_by_path(self, file_path: Path) -> Optional[ScannedFile]:
         """Get a scanned file by its path."""
-        return self._file_path_to_file.get(file_path)
+        return self._file_path_to_file.get(_path_key(file_path))
 
     def get_all_page_references(self) -> List[PageReference]:
-        """Get all page references across all files."""
-        all_pages = []
-        for scanned_file in self.scanned_files:
-            for page_num in range(1, scanned_file.page_count + 1):
-                page_ref = PageReference(scanned_file.file_id, page_num)
-                all_pages.append(page_ref)
-        return all_pages
+        """
+        Get all page references across all files.
+
+        The list is cached until files are added or removed and must not
+        be modified by callers.
+        """
+        if self._all_page_refs_cache is None:
+            all_pages = []
+            for file_id in self._file_ids:
+                all_pages.extend(self._get_file_page_references(file_id))
+            self._all_page_refs_cache = all_pages
+        return self._all_page_refs_cache
+
+    def _get_file_page_references(self, file_id: str) -> List[PageReference]:
+        """Get a file's page references, creating them once per file."""
+        page_refs = self._page_refs_by_file.get(file_id)
+        if page_refs is None:
+            page_count = self._page_counts[self._file_index[file_id]]
+            page_refs = [PageReference(file_id, page_num) for page_num in range(1, page_count + 1)]
+            self._page_refs_by_file[file_id] = page_refs
+        return page_refs
 
     def get_unassigned_pages(self) -> List[PageReference]:
         """Get pages that haven't been assigned to any document."""
@@ -217,10 +341,11 @@ class DocumentBatch:
         Raises:
             AssignmentConflictError: If pages are already assigned
         """
-        # Check for conflicts
-        conflicts = self.assignment_manager.check_page_conflicts(page_references)
-        if conflicts:
-            conflict_ids = [ref.page_id for ref in conflicts]
+        # Check for conflicts with a single membership pass over the pages
+        assigned_ids = self.assignment_manager.assigned_page_ids()
+        conflict_ids = [ref.page_id for ref in page_references if ref.page_id in assigned_ids]
+        if conflict_ids:
+            conflict_ids = list(dict.fromkeys(conflict_ids))
             raise AssignmentConflictError(
                 f"Pages already assigned: {conflict_ids}",
                 conflicting_assignments=conflict_ids
@@ -228,13 +353,14 @@ class DocumentBatch:
 
         # Create assignment
         assignment = PageAssignment(schema=self.applied_schema)
-        assignment.add_pages(page_references)
-        assignment.update_index_values(index_values)
+        with assignment.batch_update():
+            assignment.add_pages(page_references)
+            assignment.update_index_values(index_values)
 
         # Add to manager
         self.assignment_manager.add_assignment(assignment)
 
-        self.last_modified = datetime.now()
+        self._mark_modified()
         logging.info(f"Created assignment {assignment.assignment_id} with {len(page_references)} pages")
 
         return assignment
@@ -250,7 +376,7 @@ class DocumentBatch:
             bool: True if assignment was found and removed
         """
         if self.assignment_manager.remove_assignment(assignment_id):
-            self.last_modified = datetime.now()
+            self._mark_modified()
             logging.info(f"Removed assignment {assignment_id}")
             return True
         return False
@@ -259,7 +385,8 @@ class DocumentBatch:
         """Remove all page assignments."""
         assignment_count = len(self.assignment_manager.assignments)
         self.assignment_manager.clear()
-        self.last_modified = datetime.now()
+        self._preview_per_assignment.clear()
+        self._mark_modified()
         logging.info(f"Cleared {assignment_count} assignments from batch")
 
     def get_assignment_by_id(self, assignment_id: str) -> Optional[PageAssignment]:
@@ -268,11 +395,7 @@ class DocumentBatch:
 
     def get_assignments_for_file(self, file_id: str) -> List[PageAssignment]:
         """Get all assignments that contain pages from a specific file."""
-        assignments = []
-        for assignment in self.assignment_manager.assignments.values():
-            if file_id in assignment.get_file_ids():
-                assignments.append(assignment)
-        return assignments
+        return self.assignment_manager.get_assignments_for_file(file_id)
 
     def set_schema(self, schema: IndexSchema):
         """
@@ -286,17 +409,34 @@ class DocumentBatch:
         # Update all existing assignments to use this schema
         for assignment in self.assignment_manager.assignments.values():
             assignment.schema = schema
+            assignment.document_preview = None
+        self._preview_per_assignment.clear()
 
-        self.last_modified = datetime.now()
+        self._mark_modified()
         logging.info(f"Applied schema '{schema.name}' to batch")
 
     def validate_assignments(self) -> Dict[str, Any]:
         """
         Validate all assignments in the batch.
 
+        Results are reused until the batch, one of its assignments or their
+        schema is modified.
+
         Returns:
-            Dictionary with validation results
+            Dictionary with validation results; callers get their own copy
         """
+        # Assignments can be edited or added to the manager directly and
+        # schemas edited in place, so their revisions are part of the cache
+        # key alongside the version
+        state = (
+            self._version,
+            tuple((assignment_id, assignment.revision,
+                   assignment.schema.revision if assignment.schema else None)
+                  for assignment_id, assignment in self.assignment_manager.assignments.items())
+        )
+        if self._validation_results is not None and self._validation_state == state:
+            return deepcopy(self._validation_results)
+
         results = {
             'is_valid': True,
             'assignment_results': {},
@@ -308,6 +448,7 @@ class DocumentBatch:
         # Validate individual assignments
         assignment_results = self.assignment_manager.validate_all_assignments()
         results['assignment_results'] = assignment_results
+        self._preview_per_assignment.clear()
 
         # Check batch-level issues
         batch_errors = []
@@ -331,16 +472,22 @@ class DocumentBatch:
         if not self.applied_schema:
             batch_errors.append("No schema applied to batch")
 
+        # Aggregate assignment results in a single pass
+        valid_assignments = 0
+        total_errors = len(batch_errors)
+        total_warnings = len(batch_warnings)
+        for valid, errors, warnings in assignment_results.values():
+            valid_assignments += valid
+            total_errors += len(errors)
+            total_warnings += len(warnings)
+
         # Overall validation status
-        has_assignment_errors = any(not valid for valid, _, _ in assignment_results.values())
+        has_assignment_errors = valid_assignments < len(assignment_results)
         results['is_valid'] = not batch_errors and not has_assignment_errors
         results['batch_errors'] = batch_errors
         results['batch_warnings'] = batch_warnings
 
         # Calculate statistics
-        valid_assignments = sum(1 for valid, _, _ in assignment_results.values() if valid)
-        total_errors = len(batch_errors) + sum(len(errors) for _, errors, _ in assignment_results.values())
-        total_warnings = len(batch_warnings) + sum(len(warnings) for _, _, warnings in assignment_results.values())
 
         results['statistics'] = {
             'total_assignments': len(assignment_results),
@@ -352,10 +499,11 @@ class DocumentBatch:
             'filename_conflicts': len(filename_conflicts)
         }
 
-        # Cache results
+        # Cache results, handing out a copy so callers can't alter the cache
         self._validation_results = results
+        self._validation_state = state
 
-        return results
+        return deepcopy(results)
 
     def preview_output_structure(self) -> Dict[str, Any]:
         """
@@ -364,50 +512,42 @@ class DocumentBatch:
         Returns:
             Dictionary representing the folder structure
         """
-        structure = {
-            'folders': defaultdict(list),
-            'files': [],
+        folders: Dict[str, List[Dict[str, Any]]] = {}
+        files = []
+        estimated_size = 0
+
+        for assignment_id, preview in self._get_previews().items():
+            folder_path = preview.folder_path or "Root"
+            filename = f"{preview.filename}.pdf"
+
+            # Add to structure
+            folders.setdefault(folder_path, []).append({
+                'filename': filename,
+                'page_count': preview.page_count,
+                'estimated_size': preview.estimated_file_size,
+                'assignment_id': assignment_id
+            })
+
+            files.append({
+                'full_path': preview.get_full_path_str(),
+                'folder': folder_path,
+                'filename': filename,
+                'page_count': preview.page_count,
+                'estimated_size': preview.estimated_file_size
+            })
+
+            estimated_size += preview.estimated_file_size
+
+        return {
+            'folders': folders,
+            'files': files,
             'statistics': {
-                'total_documents': 0,
-                'total_folders': 0,
-                'estimated_size': 0
+                'total_documents': len(files),
+                'total_folders': len(folders),
+                'estimated_size': estimated_size
             }
         }
 
-        for assignment in self.assignment_manager.assignments.values():
-            if not assignment.is_valid:
-                continue
-
-            try:
-                preview = assignment.generate_document_preview()
-
-                # Add to structure
-                folder_path = preview.folder_path or "Root"
-                structure['folders'][folder_path].append({
-                    'filename': f"{preview.filename}.pdf",
-                    'page_count': preview.page_count,
-                    'estimated_size': preview.estimated_file_size,
-                    'assignment_id': assignment.assignment_id
-                })
-
-                structure['files'].append({
-                    'full_path': str(preview.get_full_path()),
-                    'folder': folder_path,
-                    'filename': f"{preview.filename}.pdf",
-                    'page_count': preview.page_count,
-                    'estimated_size': preview.estimated_file_size
-                })
-
-                structure['statistics']['total_documents'] += 1
-                structure['statistics']['estimated_size'] += preview.estimated_file_size
-
-            except Exception as e:
-                logging.warning(f"Could not generate preview for assignment {assignment.assignment_id}: {e}")
-
-        structure['statistics']['total_folders'] = len(structure['folders'])
-
-        return structure
-
     def calculate_output_statistics(self) -> Dict[str, Any]:
         """
         Calculate statistics about the output that will be generated.
@@ -429,33 +569,23 @@ class DocumentBatch:
 
         page_counts = []
         folders = set()
+        files_by_folder = stats['files_by_folder']
 
-        for assignment in self.assignment_manager.assignments.values():
-            if not assignment.is_valid:
-                continue
+        for preview in self._get_previews().values():
+            stats['document_count'] += 1
+            stats['total_pages'] += preview.page_count
+            stats['estimated_total_size'] += preview.estimated_file_size
 
-            try:
-                preview = assignment.generate_document_preview()
-
-                stats['document_count'] += 1
-                stats['total_pages'] += preview.page_count
-                stats['estimated_total_size'] += preview.estimated_file_size
-
-                page_counts.append(preview.page_count)
+            page_counts.append(preview.page_count)
 
-                folder_path = preview.folder_path or "Root"
-                folders.add(folder_path)
+            folder_path = preview.folder_path or "Root"
+            folders.add(folder_path)
 
-                if folder_path not in stats['files_by_folder']:
-                    stats['files_by_folder'][folder_path] = 0
-                stats['files_by_folder'][folder_path] += 1
+            files_by_folder[folder_path] = files_by_folder.get(folder_path, 0) + 1
 
-                # Page distribution (for histogram)
-                page_range = self._get_page_range(preview.page_count)
-                stats['page_distribution'][page_range] += 1
-
-            except Exception as e:
-                logging.warning(f"Could not calculate stats for assignment {assignment.assignment_id}: {e}")
+            # Page distribution (for histogram)
+            page_range = self._get_page_range(preview.page_count)
+            stats['page_distribution'][page_range] += 1
 
         # Calculate derived statistics
         if page_counts:
@@ -467,20 +597,45 @@ class DocumentBatch:
 
         return stats
 
+    def _get_previews(self) -> Dict[str, DocumentPreview]:
+        """
+        Get document previews for all valid assignments.
+
+        Previews are memoized per assignment and only regenerated when the
+        assignment's or its schema's revision changes; previews left on the
+        assignments by validation are reused.
+
+        Returns:
+            Dictionary mapping assignment_id to its DocumentPreview
+        """
+        previews = {}
+        memo = {}
+        for assignment_id, assignment in self.assignment_manager.assignments.items():
+            if not assignment.is_valid:
+                continue
+
+            revision = (assignment.revision,
+                        assignment.schema.revision if assignment.schema else None)
+            cached = self._preview_per_assignment.get(assignment_id)
+            if cached is not None and cached[0] == revision:
+                preview = cached[1]
+            else:
+                try:
+                    preview = assignment.document_preview or assignment.generate_document_preview()
+                except Exception as e:
+                    logging.warning(f"Could not generate preview for assignment {assignment_id}: {e}")
+                    continue
+
+            previews[assignment_id] = preview
+            memo[assignment_id] = (revision, preview)
+
+        # Rebuilding the memo drops entries for removed or invalid assignments
+        self._preview_per_assignment = memo
+        return previews
+
     def _get_page_range(self, page_count: int) -> str:
         """Get page count range for distribution statistics."""
-        if page_count == 1:
-            return "1 page"
-        elif page_count <= 5:
-            return "2-5 pages"
-        elif page_count <= 10:
-            return "6-10 pages"
-        elif page_count <= 25:
-            return "11-25 pages"
-        elif page_count <= 50:
-            return "26-50 pages"
-        else:
-            return "50+ pages"
+        return _PAGE_RANGE_LABELS[bisect.bisect_left(_PAGE_RANGE_THRESHOLDS, page_count)]
 
     def get_processing_summary(self) -> Dict[str, Any]:
         """
@@ -531,7 +686,7 @@ class DocumentBatch:
 
     def _invalidate_cache(self):
         """Invalidate cached properties."""
-        self._total_pages = None
+        self._all_page_refs_cache = None
         self._validation_results = None
 
     def cleanup_temp_files(self):
@@ -558,12 +713,14 @@ class DocumentBatch:
             'applied_schema_name': self.applied_schema.name if self.applied_schema else None,
             'scanned_files': [
                 {
-                    'file_id': f.file_id,
-                    'file_path': str(f.file_path),
-                    'page_count': f.page_count,
-                    'file_size': f.file_size
+                    'file_id': file_id,
+                    'file_path': file_path,
+                    'page_count': page_count,
+                    'file_size': file_size
                 }
-                for f in self.scanned_files
+                for file_id, file_path, page_count, file_size in zip(
+                    self._file_ids, self._file_paths, self._page_counts, self._file_sizes
+                )
             ],
             'assignments': [
                 assignment.to_dict()
@@ -629,8 +786,12 @@ class DocumentBatch:
             backup_data['backup_created'] = datetime.now().isoformat()
             backup_data['backup_version'] = '1.0'
 
-            with open(backup_path, 'w', encoding='utf-8') as f:
-                json.dump(backup_data, f, indent=2)
+            if orjson is not None:
+                with open(backup_path, 'wb') as f:
+                    f.write(orjson.dumps(backup_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(backup_path, 'w', encoding='utf-8') as f:
+                    f.write(json.dumps(backup_data, indent=2))
 
             logging.info(f"Created batch backup: {backup_path}")
             return True
@@ -657,6 +818,9 @@ class BatchManager:
         self.batches: Dict[str, DocumentBatch] = {}
         self.active_batch_id: Optional[str] = None
 
+        # Batch count per processing state, kept in sync by state observers
+        self._state_counts: Counter = Counter()
+
     def create_batch(self, staging_directory: Optional[Path] = None,
                      description: str = "") -> DocumentBatch:
         """Create a new document batch."""
@@ -666,6 +830,9 @@ class BatchManager:
         self.batches[batch.batch_id] = batch
         self.active_batch_id = batch.batch_id
 
+        self._state_counts[batch.processing_state] += 1
+        batch.set_state_observer(self._on_batch_state_changed)
+
         logging.info(f"Created new batch: {batch.batch_id}")
         return batch
 
@@ -691,6 +858,8 @@ class BatchManager:
         if batch_id in self.batches:
             batch = self.batches[batch_id]
             batch.cleanup_temp_files()
+            batch.set_state_observer(None)
+            self._state_counts[batch.processing_state] -= 1
             del self.batches[batch_id]
 
             if self.active_batch_id == batch_id:
@@ -717,6 +886,11 @@ class BatchManager:
             for batch in self.batches.values()
         ]
 
+    def _on_batch_state_changed(self, previous_state: ProcessingState, state: ProcessingState):
+        """Move a batch between processing state counts."""
+        self._state_counts[previous_state] -= 1
+        self._state_counts[state] += 1
+
     def cleanup_all_batches(self):
         """Clean up temporary files for all batches."""
         for batch in self.batches.values():
@@ -724,19 +898,20 @@ class BatchManager:
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get statistics across all managed batches."""
-        total_batches = len(self.batches)
-        total_files = sum(batch.file_count for batch in self.batches.values())
-        total_pages = sum(batch.total_pages for batch in self.batches.values())
-        total_assignments = sum(batch.assignment_count for batch in self.batches.values())
+        total_files = total_pages = total_assignments = 0
+        for batch in self.batches.values():
+            total_files += batch.file_count
+            total_pages += batch.total_pages
+            total_assignments += batch.assignment_count
 
         return {
-            'total_batches': total_batches,
+            'total_batches': len(self.batches),
             'total_files': total_files,
             'total_pages': total_pages,
             'total_assignments': total_assignments,
             'active_batch_id': self.active_batch_id,
             'batches_by_state': {
-                state.name: len([b for b in self.batches.values() if b.processing_state == state])
+                state.name: self._state_counts[state]
                 for state in ProcessingState
             }
-        }
\ No newline at end of file
+        }
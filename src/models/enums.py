@@ -5,7 +5,18 @@ Defines all enumeration types and constants used throughout the application
 for type safety and consistent behavior.
 """
 
-from enum import Enum, auto
+import re
+from enum import Enum, IntEnum, auto
+
+
+# Lookup tables (display names, colors, levels) are attached to the enum
+# classes once after each definition, since enum members cannot change at
+# runtime; the accessors read them instead of rebuilding a dict per call.
+def _set_display_names(enum_cls, display_names):
+    """Attach display names to an enum class and to each of its members."""
+    enum_cls._DISPLAY_NAMES = display_names
+    for member, display_name in display_names.items():
+        member._display_name = display_name
 
 
 class FieldType(Enum):
@@ -19,17 +30,20 @@ class FieldType(Enum):
     @classmethod
     def get_display_names(cls):
         """Get user-friendly display names for field types."""
-        return {
-            cls.TEXT: "Text",
-            cls.DATE: "Date",
-            cls.NUMBER: "Number",
-            cls.DROPDOWN: "Dropdown",
-            cls.BOOLEAN: "Yes/No"
-        }
+        return cls._DISPLAY_NAMES
 
     def get_display_name(self):
         """Get display name for this field type."""
-        return self.get_display_names()[self]
+        return self._display_name
+
+
+_set_display_names(FieldType, {
+    FieldType.TEXT: "Text",
+    FieldType.DATE: "Date",
+    FieldType.NUMBER: "Number",
+    FieldType.DROPDOWN: "Dropdown",
+    FieldType.BOOLEAN: "Yes/No"
+})
 
 
 class FieldRole(Enum):
@@ -41,15 +55,18 @@ class FieldRole(Enum):
     @classmethod
     def get_display_names(cls):
         """Get user-friendly display names for field roles."""
-        return {
-            cls.FOLDER: "Folder Structure",
-            cls.FILENAME: "File Name",
-            cls.METADATA: "Metadata Only"
-        }
+        return cls._DISPLAY_NAMES
 
     def get_display_name(self):
         """Get display name for this field role."""
-        return self.get_display_names()[self]
+        return self._display_name
+
+
+_set_display_names(FieldRole, {
+    FieldRole.FOLDER: "Folder Structure",
+    FieldRole.FILENAME: "File Name",
+    FieldRole.METADATA: "Metadata Only"
+})
 
 
 class SelectionMode(Enum):
@@ -78,19 +95,22 @@ class ConflictType(Enum):
     @classmethod
     def get_display_names(cls):
         """Get user-friendly display names for conflict types."""
-        return {
-            cls.DUPLICATE_FILENAME: "Duplicate File Name",
-            cls.INVALID_PATH: "Invalid Path",
-            cls.MISSING_REQUIRED_FIELD: "Missing Required Field",
-            cls.INVALID_FIELD_VALUE: "Invalid Field Value",
-            cls.PATH_TOO_LONG: "Path Too Long",
-            cls.RESERVED_NAME: "Reserved System Name",
-            cls.INVALID_CHARACTERS: "Invalid Characters in Path"
-        }
+        return cls._DISPLAY_NAMES
 
     def get_display_name(self):
         """Get display name for this conflict type."""
-        return self.get_display_names()[self]
+        return self._display_name
+
+
+_set_display_names(ConflictType, {
+    ConflictType.DUPLICATE_FILENAME: "Duplicate File Name",
+    ConflictType.INVALID_PATH: "Invalid Path",
+    ConflictType.MISSING_REQUIRED_FIELD: "Missing Required Field",
+    ConflictType.INVALID_FIELD_VALUE: "Invalid Field Value",
+    ConflictType.PATH_TOO_LONG: "Path Too Long",
+    ConflictType.RESERVED_NAME: "Reserved System Name",
+    ConflictType.INVALID_CHARACTERS: "Invalid Characters in Path"
+})
 
 
 class ConflictResolution(Enum):
@@ -104,17 +124,20 @@ class ConflictResolution(Enum):
     @classmethod
     def get_display_names(cls):
         """Get user-friendly display names for resolution strategies."""
-        return {
-            cls.AUTO_RENAME: "Automatically Rename",
-            cls.PROMPT_USER: "Ask Me Each Time",
-            cls.SKIP_DUPLICATE: "Skip Duplicates",
-            cls.OVERWRITE: "Overwrite Existing",
-            cls.MERGE: "Merge When Possible"
-        }
+        return cls._DISPLAY_NAMES
 
     def get_display_name(self):
         """Get display name for this resolution strategy."""
-        return self.get_display_names()[self]
+        return self._display_name
+
+
+_set_display_names(ConflictResolution, {
+    ConflictResolution.AUTO_RENAME: "Automatically Rename",
+    ConflictResolution.PROMPT_USER: "Ask Me Each Time",
+    ConflictResolution.SKIP_DUPLICATE: "Skip Duplicates",
+    ConflictResolution.OVERWRITE: "Overwrite Existing",
+    ConflictResolution.MERGE: "Merge When Possible"
+})
 
 
 class PDFQuality(Enum):
@@ -127,26 +150,30 @@ class PDFQuality(Enum):
     @classmethod
     def get_display_names(cls):
         """Get user-friendly display names for quality settings."""
-        return {
-            cls.LOW: "Low (Smallest File)",
-            cls.MEDIUM: "Medium (Balanced)",
-            cls.HIGH: "High (Better Quality)",
-            cls.ORIGINAL: "Original (No Compression)"
-        }
+        return cls._DISPLAY_NAMES
 
     def get_display_name(self):
         """Get display name for this quality setting."""
-        return self.get_display_names()[self]
+        return self._display_name
 
     def get_compression_level(self):
         """Get compression level (0-100) for this quality."""
-        levels = {
-            self.LOW: 30,
-            self.MEDIUM: 60,
-            self.HIGH: 85,
-            self.ORIGINAL: 100
-        }
-        return levels[self]
+        return self._COMPRESSION_LEVELS[self]
+
+
+_set_display_names(PDFQuality, {
+    PDFQuality.LOW: "Low (Smallest File)",
+    PDFQuality.MEDIUM: "Medium (Balanced)",
+    PDFQuality.HIGH: "High (Better Quality)",
+    PDFQuality.ORIGINAL: "Original (No Compression)"
+})
+
+PDFQuality._COMPRESSION_LEVELS = {
+    PDFQuality.LOW: 30,
+    PDFQuality.MEDIUM: 60,
+    PDFQuality.HIGH: 85,
+    PDFQuality.ORIGINAL: 100
+}
 
 
 class NamingStrategy(Enum):
@@ -160,20 +187,23 @@ class NamingStrategy(Enum):
     @classmethod
     def get_display_names(cls):
         """Get user-friendly display names for naming strategies."""
-        return {
-            cls.PRESERVE_ORIGINAL: "Keep Original Names",
-            cls.TIMESTAMP: "Use Timestamps",
-            cls.SEQUENTIAL: "Sequential Numbering",
-            cls.SCHEMA_BASED: "Use Index Values",
-            cls.CUSTOM_TEMPLATE: "Custom Template"
-        }
+        return cls._DISPLAY_NAMES
 
     def get_display_name(self):
         """Get display name for this naming strategy."""
-        return self.get_display_names()[self]
+        return self._display_name
 
 
-class ProcessingState(Enum):
+_set_display_names(NamingStrategy, {
+    NamingStrategy.PRESERVE_ORIGINAL: "Keep Original Names",
+    NamingStrategy.TIMESTAMP: "Use Timestamps",
+    NamingStrategy.SEQUENTIAL: "Sequential Numbering",
+    NamingStrategy.SCHEMA_BASED: "Use Index Values",
+    NamingStrategy.CUSTOM_TEMPLATE: "Custom Template"
+})
+
+
+class ProcessingState(IntEnum):
     """States for batch processing operations."""
     IDLE = auto()
     PREPARING = auto()
@@ -186,12 +216,21 @@ class ProcessingState(Enum):
     @property
     def is_active(self):
         """Check if this state represents active processing."""
-        return self in (self.PREPARING, self.PROCESSING, self.COMPLETING)
+        return self in _ACTIVE_PROCESSING_STATES
 
     @property
     def is_finished(self):
         """Check if this state represents finished processing."""
-        return self in (self.COMPLETED, self.ERROR, self.CANCELLED)
+        return self in _FINISHED_PROCESSING_STATES
+
+
+# IntEnum members hash and compare as ints, so these checks stay in C
+_ACTIVE_PROCESSING_STATES = frozenset({
+    ProcessingState.PREPARING, ProcessingState.PROCESSING, ProcessingState.COMPLETING
+})
+_FINISHED_PROCESSING_STATES = frozenset({
+    ProcessingState.COMPLETED, ProcessingState.ERROR, ProcessingState.CANCELLED
+})
 
 
 class ThumbnailSize(Enum):
@@ -204,11 +243,12 @@ class ThumbnailSize(Enum):
     def __init__(self, width, height):
         self.width = width
         self.height = height
+        self._size_tuple = (width, height)
 
     @property
     def size_tuple(self):
         """Get size as (width, height) tuple."""
-        return (self.width, self.height)
+        return self._size_tuple
 
     @classmethod
     def get_default(cls):
@@ -235,21 +275,28 @@ class ValidationSeverity(Enum):
     @property
     def blocks_processing(self):
         """Check if this severity level blocks processing."""
-        return self in (self.ERROR, self.CRITICAL)
+        return self._blocks_processing
 
     @classmethod
     def get_color_codes(cls):
         """Get color codes for different severity levels."""
-        return {
-            cls.INFO: "#2196F3",  # Blue
-            cls.WARNING: "#FF9800",  # Orange
-            cls.ERROR: "#F44336",  # Red
-            cls.CRITICAL: "#9C27B0"  # Purple
-        }
+        return cls._COLOR_CODES
 
     def get_color(self):
         """Get color code for this severity level."""
-        return self.get_color_codes()[self]
+        return self._COLOR_CODES[self]
+
+
+ValidationSeverity._COLOR_CODES = {
+    ValidationSeverity.INFO: "#2196F3",  # Blue
+    ValidationSeverity.WARNING: "#FF9800",  # Orange
+    ValidationSeverity.ERROR: "#F44336",  # Red
+    ValidationSeverity.CRITICAL: "#9C27B0"  # Purple
+}
+
+for _severity in ValidationSeverity:
+    _severity._blocks_processing = _severity in (ValidationSeverity.ERROR, ValidationSeverity.CRITICAL)
+del _severity
 
 
 class SortOrder(Enum):
@@ -270,20 +317,24 @@ class FileFormat(Enum):
     @classmethod
     def get_supported_extensions(cls):
         """Get supported file extensions."""
-        return {cls.PDF: [".pdf"]}
+        return cls._SUPPORTED_EXTENSIONS
 
     def get_extensions(self):
         """Get file extensions for this format."""
-        return self.get_supported_extensions()[self]
+        return self._SUPPORTED_EXTENSIONS[self]
 
     @classmethod
     def from_extension(cls, extension: str):
         """Get format from file extension."""
-        extension = extension.lower()
-        for format_type, extensions in cls.get_supported_extensions().items():
-            if extension in extensions:
-                return format_type
-        return None
+        return cls._EXTENSION_TO_FORMAT.get(extension.lower())
+
+
+FileFormat._SUPPORTED_EXTENSIONS = {FileFormat.PDF: [".pdf"]}
+FileFormat._EXTENSION_TO_FORMAT = {
+    extension: format_type
+    for format_type, extensions in FileFormat._SUPPORTED_EXTENSIONS.items()
+    for extension in extensions
+}
 
 
 # Application constants
@@ -332,31 +383,38 @@ class AppConstants:
     ]
 
     # Reserved file/folder names (Windows)
-    RESERVED_NAMES = {
+    RESERVED_NAMES = frozenset({
         "CON", "PRN", "AUX", "NUL",
         "COM1", "COM2", "COM3", "COM4", "COM5", "COM6", "COM7", "COM8", "COM9",
         "LPT1", "LPT2", "LPT3", "LPT4", "LPT5", "LPT6", "LPT7", "LPT8", "LPT9"
-    }
+    })
+    _RESERVED_NAME_LENGTHS = frozenset(len(name) for name in RESERVED_NAMES)
 
     # Invalid path characters
-    INVALID_PATH_CHARS = set('<>:"|?*')
+    INVALID_PATH_CHARS = frozenset('<>:"|?*')
 
     @classmethod
     def is_reserved_name(cls, name: str) -> bool:
         """Check if a name is reserved by the operating system."""
+        # ASCII names keep their length when uppercased, so most names can
+        # be ruled out without allocating an uppercase copy
+        if name.isascii():
+            if len(name) not in cls._RESERVED_NAME_LENGTHS:
+                return False
+            if name.isupper():
+                return name in cls.RESERVED_NAMES
         return name.upper() in cls.RESERVED_NAMES
 
     @classmethod
     def has_invalid_chars(cls, path: str) -> bool:
         """Check if a path contains invalid characters."""
-        return any(char in cls.INVALID_PATH_CHARS for char in path)
+        return _INVALID_PATH_CHARS_RE.search(path) is not None
 
     @classmethod
     def get_safe_filename(cls, filename: str) -> str:
         """Create a safe filename by removing invalid characters."""
         # Replace invalid characters with underscore
-        safe_name = ''.join('_' if char in cls.INVALID_PATH_CHARS else char
-                            for char in filename)
+        safe_name = filename.translate(_SAFE_FILENAME_TABLE)
 
         # Handle reserved names
         if cls.is_reserved_name(safe_name.split('.')[0]):
@@ -368,4 +426,13 @@ class AppConstants:
             max_name_len = cls.MAX_FILENAME_LENGTH - len(ext) - 1 if ext else cls.MAX_FILENAME_LENGTH
             safe_name = f"{name[:max_name_len]}.{ext}" if ext else name[:max_name_len]
 
-        return safe_name
\ No newline at end of file
+        return safe_name
+
+
+# Compiled once so has_invalid_chars runs a single C-level scan
+_INVALID_PATH_CHARS_RE = re.compile(
+    '[' + re.escape(''.join(sorted(AppConstants.INVALID_PATH_CHARS))) + ']'
+)
+
+# Maps each invalid character to an underscore for get_safe_filename
+_SAFE_FILENAME_TABLE = str.maketrans(dict.fromkeys(AppConstants.INVALID_PATH_CHARS, '_'))
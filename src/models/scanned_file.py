@@ -5,16 +5,74 @@ Represents individual PDF files from NAPS2 with metadata, thumbnail generation,
 and page manipulation capabilities.
 """
 
+import os
+import mmap
+import stat
 import hashlib
 import logging
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional, Any, Tuple, List
 import uuid
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 
 from ..core.exceptions import FileProcessingError, PDFProcessingError
 from .enums import ThumbnailSize, FileFormat
 
+# Upper bound on threads used to create scanned files concurrently
+MAX_CREATE_WORKERS = 32
+
+# Files up to this size are hashed through a memory map in one call
+MMAP_HASH_LIMIT = 128 * 1024 * 1024
+
+# Chunk size for hashing files too large (or unsuitable) to map
+HASH_CHUNK_SIZE = 64 * 1024
+
+# File ids are a per-process counter plus a random session suffix, so they
+# stay unique across sessions (ids are persisted in batch backups) without
+# drawing a fresh uuid for every file. next() on a count is atomic under the GIL.
+_FILE_ID_SESSION = uuid.uuid4().hex[:12]
+_file_id_counter = itertools.count(1)
+
+# Application signals, imported on first use so models stay free of Qt
+_app_signals = None
+
+
+def _get_app_signals():
+    """Return the global application signals, importing them once."""
+    global _app_signals
+    if _app_signals is None:
+        from ..core.signals import app_signals
+        _app_signals = app_signals
+    return _app_signals
+
+
+class PDFMetadata:
+    """Basic document metadata read from a PDF file."""
+
+    __slots__ = ('title', 'creator', 'creation_date', 'file_size')
+
+    def __init__(self, title: str, creator: str, creation_date: datetime, file_size: int):
+        self.title = title
+        self.creator = creator
+        self.creation_date = creation_date
+        self.file_size = file_size
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize metadata to dictionary."""
+        return {
+            'title': self.title,
+            'creator': self.creator,
+            'creation_date': self.creation_date,
+            'file_size': self.file_size
+        }
+
+    def __repr__(self) -> str:
+        """Detailed string representation."""
+        return (f"PDFMetadata(title='{self.title}', creator='{self.creator}', "
+                f"creation_date={self.creation_date!r}, file_size={self.file_size})")
+
 
 class ScannedFile:
     """
@@ -26,27 +84,32 @@ class ScannedFile:
 
     def __init__(self, file_path: Path):
         self.file_path = Path(file_path)
-        self.file_id = str(uuid.uuid4())
+        self._is_pdf_ext = self.file_path.suffix.lower() == '.pdf'
+        self.file_id = f"{next(_file_id_counter):08x}-{_FILE_ID_SESSION}"
 
         # Cache properties
         self._page_count: Optional[int] = None
         self._file_size: Optional[int] = None
         self._scan_timestamp: Optional[datetime] = None
         self._file_hash: Optional[str] = None
-        self._pdf_metadata: Optional[Dict[str, Any]] = None
+        self._pdf_metadata: Optional[PDFMetadata] = None
+        self._fast_key: Optional[Tuple[int, int, str]] = None
+        self._stat: Optional[os.stat_result] = None
 
-        # Thumbnail cache: page_number -> thumbnail_path
-        self.thumbnail_cache: Dict[int, Path] = {}
+        # Thumbnail cache: (page_number, size) -> thumbnail_path
+        self.thumbnail_cache: Dict[Tuple[int, ThumbnailSize], Path] = {}
 
         # State tracking
         self.is_corrupted = False
         self._metadata_loaded = False
 
         # Validate file exists and is accessible
-        if not self.file_path.exists():
+        try:
+            file_stat = self._get_stat()
+        except OSError:
             raise FileProcessingError(f"File not found: {file_path}")
 
-        if not self.file_path.is_file():
+        if not stat.S_ISREG(file_stat.st_mode):
             raise FileProcessingError(f"Path is not a file: {file_path}")
 
         # Initial validation
@@ -56,16 +119,22 @@ class ScannedFile:
             logging.warning(f"PDF validation failed for {file_path}: {e}")
             self.is_corrupted = True
 
+    def _get_stat(self) -> os.stat_result:
+        """Get the file's stat result, calling stat() once until refreshed."""
+        if self._stat is None:
+            self._stat = self.file_path.stat()
+        return self._stat
+
     def _validate_pdf(self):
         """Validate that the file is a readable PDF."""
         # Check file extension
-        if self.file_path.suffix.lower() != '.pdf':
+        if not self._is_pdf_ext:
             raise PDFProcessingError("File is not a PDF", str(self.file_path))
 
         # Try to read basic PDF information
         # This will be implemented when we add PDF processing utilities
         # For now, we'll do basic file size check
-        if self.file_path.stat().st_size < 100:  # Less than 100 bytes is suspicious
+        if self._get_stat().st_size < 100:  # Less than 100 bytes is suspicious
             raise PDFProcessingError("PDF file appears to be corrupted or empty", str(self.file_path))
 
     @property
@@ -80,7 +149,7 @@ class ScannedFile:
         """Get file size in bytes."""
         if self._file_size is None:
             try:
-                self._file_size = self.file_path.stat().st_size
+                self._file_size = self._get_stat().st_size
             except OSError as e:
                 raise FileProcessingError(f"Cannot access file size: {e}", str(self.file_path))
         return self._file_size
@@ -90,20 +159,20 @@ class ScannedFile:
         """Get the file creation/modification timestamp."""
         if self._scan_timestamp is None:
             try:
-                stat = self.file_path.stat()
+                file_stat = self._get_stat()
                 # Use creation time if available (Windows), otherwise modification time
-                timestamp = getattr(stat, 'st_birthtime', None) or stat.st_mtime
+                timestamp = getattr(file_stat, 'st_birthtime', None) or file_stat.st_mtime
                 self._scan_timestamp = datetime.fromtimestamp(timestamp)
             except OSError as e:
                 raise FileProcessingError(f"Cannot access file timestamp: {e}", str(self.file_path))
         return self._scan_timestamp
 
     @property
-    def pdf_metadata(self) -> Dict[str, Any]:
-        """Get PDF metadata dictionary."""
+    def pdf_metadata(self) -> Optional[PDFMetadata]:
+        """Get PDF metadata, or None if it could not be loaded."""
         if self._pdf_metadata is None:
             self._load_pdf_metadata()
-        return self._pdf_metadata or {}
+        return self._pdf_metadata
 
     def _load_pdf_metadata(self):
         """Load PDF metadata including page count."""
@@ -113,12 +182,12 @@ class ScannedFile:
         try:
             # This will be implemented when we add PDF utilities
             # For now, provide basic fallback
-            self._pdf_metadata = {
-                'title': self.file_path.stem,
-                'creator': 'NAPS2',
-                'creation_date': self.scan_timestamp,
-                'file_size': self.file_size
-            }
+            self._pdf_metadata = PDFMetadata(
+                title=self.file_path.stem,
+                creator='NAPS2',
+                creation_date=self.scan_timestamp,
+                file_size=self.file_size
+            )
 
             # Estimate page count based on file size as fallback
             # This is very rough - real implementation will use PDF library
@@ -130,23 +199,39 @@ class ScannedFile:
         except Exception as e:
             logging.error(f"Failed to load PDF metadata for {self.file_path}: {e}")
             self.is_corrupted = True
-            self._pdf_metadata = {}
+            self._pdf_metadata = None
             self._page_count = 0
 
     def get_file_hash(self) -> str:
         """Generate unique hash for file identification."""
         if self._file_hash is None:
             try:
-                hasher = hashlib.md5()
+                # Identification only, not security: BLAKE2b is faster than MD5
+                # and a 16-byte digest keeps the same hex length
+                hasher = hashlib.blake2b(digest_size=16)
                 with open(self.file_path, 'rb') as f:
-                    # Read in chunks for memory efficiency
-                    for chunk in iter(lambda: f.read(8192), b""):
-                        hasher.update(chunk)
+                    size = os.fstat(f.fileno()).st_size
+                    if 0 < size <= MMAP_HASH_LIMIT:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                            hasher.update(mapped)
+                    else:
+                        # Read in chunks into one reusable buffer
+                        buffer = bytearray(HASH_CHUNK_SIZE)
+                        view = memoryview(buffer)
+                        while (read := f.readinto(buffer)):
+                            hasher.update(view[:read])
                 self._file_hash = hasher.hexdigest()
             except IOError as e:
                 raise FileProcessingError(f"Cannot read file for hashing: {e}", str(self.file_path))
         return self._file_hash
 
+    def _get_fast_key(self) -> Tuple[int, int, str]:
+        """Get (size, mtime_ns, resolved path) for cheap equality checks."""
+        if self._fast_key is None:
+            file_stat = self._get_stat()
+            self._fast_key = (file_stat.st_size, file_stat.st_mtime_ns, str(self.file_path.resolve()))
+        return self._fast_key
+
     def is_valid_pdf(self) -> bool:
         """Check if the PDF file is valid and readable."""
         return not self.is_corrupted and self.page_count > 0
@@ -154,15 +239,15 @@ class ScannedFile:
     def get_file_metadata(self) -> Dict[str, Any]:
         """Get complete file system metadata."""
         try:
-            stat = self.file_path.stat()
+            file_stat = self._get_stat()
             return {
                 'file_path': str(self.file_path),
                 'file_name': self.file_path.name,
-                'file_size': stat.st_size,
-                'created': datetime.fromtimestamp(getattr(stat, 'st_birthtime', stat.st_ctime)),
-                'modified': datetime.fromtimestamp(stat.st_mtime),
-                'accessed': datetime.fromtimestamp(stat.st_atime),
-                'is_readonly': not stat.st_mode & 0o200,
+                'file_size': file_stat.st_size,
+                'created': datetime.fromtimestamp(getattr(file_stat, 'st_birthtime', file_stat.st_ctime)),
+                'modified': datetime.fromtimestamp(file_stat.st_mtime),
+                'accessed': datetime.fromtimestamp(file_stat.st_atime),
+                'is_readonly': not file_stat.st_mode & 0o200,
                 'file_hash': self.get_file_hash(),
                 'page_count': self.page_count,
                 'is_valid': self.is_valid_pdf()
@@ -190,26 +275,22 @@ class ScannedFile:
             )
 
         # Check cache first
-        cache_key = f"{page_number}_{size.value}"
-        if cache_key in self.thumbnail_cache:
-            thumbnail_path = self.thumbnail_cache[cache_key]
-            if thumbnail_path.exists():
-                return thumbnail_path
+        thumbnail_path = self.thumbnail_cache.get((page_number, size))
+        if thumbnail_path is not None and thumbnail_path.exists():
+            return thumbnail_path
 
         # Generate new thumbnail
         try:
             # This will be implemented with actual PDF processing
             # For now, return placeholder
-            from ..core.application import app_signals
-
-            # Create thumbnail filename
+            # Create thumbnail filename (only needed on a cache miss)
             thumbnail_name = f"{self.file_id}_p{page_number:03d}_{size.width}x{size.height}.png"
 
             # This would normally generate the actual thumbnail
             # thumbnail_path = self._create_thumbnail(page_number, size, thumbnail_name)
 
             # Placeholder implementation - signal that thumbnail generation is needed
-            app_signals.thumbnail_generation_progress.emit(page_number, self.page_count)
+            _get_app_signals().emit_thumbnail_progress(page_number, self.page_count)
 
             # Return None for now - real implementation will return actual path
             return None
@@ -259,6 +340,8 @@ class ScannedFile:
         self._scan_timestamp = None
         self._file_hash = None
         self._pdf_metadata = None
+        self._fast_key = None
+        self._stat = None
         self._metadata_loaded = False
 
         # Clear thumbnail cache
@@ -274,8 +357,7 @@ class ScannedFile:
 
     def get_thumbnail_path(self, page_number: int, size: ThumbnailSize) -> Optional[Path]:
         """Get cached thumbnail path if available."""
-        cache_key = f"{page_number}_{size.value}"
-        return self.thumbnail_cache.get(cache_key)
+        return self.thumbnail_cache.get((page_number, size))
 
     def has_thumbnail(self, page_number: int, size: ThumbnailSize) -> bool:
         """Check if thumbnail exists for given page and size."""
@@ -288,12 +370,8 @@ class ScannedFile:
 
     def estimate_extraction_time(self, page_count: int) -> float:
         """Estimate time needed to extract given number of pages (in seconds)."""
-        # Very rough estimation based on file size and page count
-        base_time = 0.5  # Base processing time
-        size_factor = self.file_size / 1_000_000  # Size in MB
-        page_factor = page_count * 0.1  # Time per page
-
-        return base_time + (size_factor * 0.1) + page_factor
+        # Very rough estimation: 0.5s base, 0.1s per MB and 0.1s per page
+        return 0.5 + self.file_size * 1e-7 + page_count * 0.1
 
     def __str__(self) -> str:
         """String representation."""
@@ -305,10 +383,22 @@ class ScannedFile:
                 f"size={self.file_size:,} bytes, valid={self.is_valid_pdf()})")
 
     def __eq__(self, other) -> bool:
-        """Equality comparison based on file hash."""
+        """Equality comparison based on file content."""
+        if self is other:
+            return True
         if not isinstance(other, ScannedFile):
             return False
+        # Same instance identity or same path on disk: nothing to read
+        if self.file_id == other.file_id or self.file_path == other.file_path:
+            return True
         try:
+            # Same file unchanged on disk, or sizes differ: no need to hash
+            fast_key = self._get_fast_key()
+            other_key = other._get_fast_key()
+            if fast_key == other_key:
+                return True
+            if fast_key[0] != other_key[0]:
+                return False
             return self.get_file_hash() == other.get_file_hash()
         except Exception:
             return self.file_path == other.file_path
@@ -343,18 +433,21 @@ class ScannedFileFactory:
         """
         Create multiple ScannedFile instances, skipping failed ones.
 
+        Files are created on a thread pool since construction is dominated
+        by file system calls, which release the GIL.
+
         Args:
             file_paths: List of paths to PDF files
 
         Returns:
-            List of successfully created ScannedFile instances
+            List of successfully created ScannedFile instances, in input order
         """
-        scanned_files = []
-        for path in file_paths:
-            scanned_file = ScannedFileFactory.create_from_path(path)
-            if scanned_file:
-                scanned_files.append(scanned_file)
-        return scanned_files
+        if len(file_paths) <= 1:
+            results = [ScannedFileFactory.create_from_path(path) for path in file_paths]
+        else:
+            with ThreadPoolExecutor(max_workers=min(MAX_CREATE_WORKERS, len(file_paths))) as executor:
+                results = list(executor.map(ScannedFileFactory.create_from_path, file_paths))
+        return [scanned_file for scanned_file in results if scanned_file]
 
     @staticmethod
     def validate_pdf_file(file_path: Path) -> Tuple[bool, Optional[str]]:
@@ -368,16 +461,19 @@ class ScannedFileFactory:
             Tuple of (is_valid, error_message)
         """
         try:
-            if not file_path.exists():
+            # One stat() answers existence, file type and size
+            try:
+                file_stat = os.stat(file_path)
+            except (FileNotFoundError, NotADirectoryError):
                 return False, "File does not exist"
 
-            if not file_path.is_file():
+            if not stat.S_ISREG(file_stat.st_mode):
                 return False, "Path is not a file"
 
             if file_path.suffix.lower() != '.pdf':
                 return False, "File is not a PDF"
 
-            if file_path.stat().st_size < 100:
+            if file_stat.st_size < 100:
                 return False, "File appears to be empty or corrupted"
 
             return True, None
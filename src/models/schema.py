@@ -7,14 +7,49 @@ including individual fields and complete schema definitions.
 
 import json
 import re
+import string
+import functools
 from datetime import datetime, date
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, FrozenSet, Tuple
 from copy import deepcopy
 
 from .enums import FieldType, FieldRole, AppConstants
 from ..core.exceptions import SchemaValidationError
 
+# Date formats accepted by DATE fields, tried in order
+_DATE_FORMATS = (
+    '%Y-%m-%d',  # 2024-01-15
+    '%m/%d/%Y',  # 01/15/2024
+    '%d/%m/%Y',  # 15/01/2024
+    '%Y/%m/%d',  # 2024/01/15
+    '%m-%d-%Y',  # 01-15-2024
+    '%d-%m-%Y',  # 15-01-2024
+)
+
+# Date and time variables available to filename templates
+_TEMPLATE_DATE_FORMATS = (
+    ('date', '%Y-%m-%d'),
+    ('time', '%H-%M-%S'),
+)
+
+# Accepted spellings of true and false for BOOLEAN fields
+_BOOLEAN_VALUES = frozenset({
+    'true', 'yes', '1', 'on', 'checked',
+    'false', 'no', '0', 'off', 'unchecked', '',
+})
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date(value: str) -> Optional[date]:
+    """Parse a date string in the first matching format, caching the result."""
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    return None
+
 
 class IndexField:
     """
@@ -37,10 +72,44 @@ class IndexField:
         self.description = ""
         self.placeholder_text = ""
 
+        # Compiled form of validation_rules['pattern'], see _get_pattern()
+        self._pattern_source: Optional[str] = None
+        self._compiled_pattern: Optional[re.Pattern] = None
+
         # Auto-set dropdown options list for dropdown fields
         if field_type == FieldType.DROPDOWN and self.dropdown_options is None:
             self.dropdown_options = []
 
+    @property
+    def name(self) -> str:
+        """Field name as shown to the user and used in assignment values."""
+        return self._name
+
+    @name.setter
+    def name(self, name: str):
+        self._name = name
+        self._template_key = name.lower().replace(' ', '_')
+
+    @property
+    def template_key(self) -> str:
+        """Name of this field's variable in filename templates."""
+        return self._template_key
+
+    @property
+    def dropdown_options(self) -> Optional[List[str]]:
+        """
+        Options offered by a dropdown field.
+
+        Assign a new list to change them; membership checks use a set
+        built on assignment.
+        """
+        return self._dropdown_options
+
+    @dropdown_options.setter
+    def dropdown_options(self, options: Optional[List[str]]):
+        self._dropdown_options = options
+        self._dropdown_option_set: FrozenSet[str] = frozenset(options) if options else frozenset()
+
     def validate_value(self, value: Any) -> tuple[bool, Optional[str]]:
         """
         Validate a value against this field's rules.
@@ -61,20 +130,11 @@ class IndexField:
         str_value = str(value).strip()
 
         # Type-specific validation
+        validator = self._VALIDATORS.get(self.field_type)
+        if validator is None:
+            return False, f"Unknown field type: {self.field_type}"
         try:
-            if self.field_type == FieldType.TEXT:
-                return self._validate_text(str_value)
-            elif self.field_type == FieldType.DATE:
-                return self._validate_date(str_value)
-            elif self.field_type == FieldType.NUMBER:
-                return self._validate_number(str_value)
-            elif self.field_type == FieldType.DROPDOWN:
-                return self._validate_dropdown(str_value)
-            elif self.field_type == FieldType.BOOLEAN:
-                return self._validate_boolean(str_value)
-            else:
-                return False, f"Unknown field type: {self.field_type}"
-
+            return validator(self, str_value)
         except Exception as e:
             return False, f"Validation error: {str(e)}"
 
@@ -91,8 +151,8 @@ class IndexField:
             return False, f"Text cannot exceed {max_length} characters"
 
         # Check pattern if specified
-        pattern = self.validation_rules.get('pattern')
-        if pattern and not re.match(pattern, value):
+        pattern = self._get_pattern()
+        if pattern is not None and not pattern.match(value):
             pattern_desc = self.validation_rules.get('pattern_description', 'required format')
             return False, f"Text must match {pattern_desc}"
 
@@ -105,26 +165,18 @@ class IndexField:
 
         return True, None
 
+    def _get_pattern(self) -> Optional[re.Pattern]:
+        """Return the compiled validation pattern, recompiling only when it changes."""
+        source = self.validation_rules.get('pattern')
+        if source != self._pattern_source:
+            self._compiled_pattern = re.compile(source) if source else None
+            self._pattern_source = source
+        return self._compiled_pattern
+
     def _validate_date(self, value: str) -> tuple[bool, Optional[str]]:
         """Validate date field value."""
         # Try common date formats
-        date_formats = [
-            '%Y-%m-%d',  # 2024-01-15
-            '%m/%d/%Y',  # 01/15/2024
-            '%d/%m/%Y',  # 15/01/2024
-            '%Y/%m/%d',  # 2024/01/15
-            '%m-%d-%Y',  # 01-15-2024
-            '%d-%m-%Y',  # 15-01-2024
-        ]
-
-        parsed_date = None
-        for fmt in date_formats:
-            try:
-                parsed_date = datetime.strptime(value, fmt).date()
-                break
-            except ValueError:
-                continue
-
+        parsed_date = _parse_date(value)
         if parsed_date is None:
             return False, "Invalid date format. Use YYYY-MM-DD, MM/DD/YYYY, or similar"
 
@@ -172,21 +224,27 @@ class IndexField:
         if not self.dropdown_options:
             return False, "No dropdown options defined"
 
-        if value not in self.dropdown_options:
+        if value not in self._dropdown_option_set:
             return False, f"Must select one of: {', '.join(self.dropdown_options)}"
 
         return True, None
 
     def _validate_boolean(self, value: str) -> tuple[bool, Optional[str]]:
         """Validate boolean field value."""
-        valid_true = {'true', 'yes', '1', 'on', 'checked'}
-        valid_false = {'false', 'no', '0', 'off', 'unchecked', ''}
-
-        if value.lower() not in valid_true and value.lower() not in valid_false:
+        if value.lower() not in _BOOLEAN_VALUES:
             return False, "Must be yes/no, true/false, or 1/0"
 
         return True, None
 
+    # Validator for each field type, see validate_value()
+    _VALIDATORS = {
+        FieldType.TEXT: _validate_text,
+        FieldType.DATE: _validate_date,
+        FieldType.NUMBER: _validate_number,
+        FieldType.DROPDOWN: _validate_dropdown,
+        FieldType.BOOLEAN: _validate_boolean,
+    }
+
     def get_default_value(self) -> str:
         """Get the default value for this field."""
         if self.default_value is not None:
@@ -242,7 +300,14 @@ class IndexField:
 
     def clone(self) -> 'IndexField':
         """Create a copy of this field."""
-        return IndexField.from_dict(self.to_dict())
+        field = IndexField(self.name, self.field_type, self.role, self.required)
+        field.default_value = self.default_value
+        field.validation_rules = dict(self.validation_rules)
+        field.display_order = self.display_order
+        field.dropdown_options = list(self.dropdown_options) if self.dropdown_options is not None else None
+        field.description = self.description
+        field.placeholder_text = self.placeholder_text
+        return field
 
 
 class IndexSchema:
@@ -258,6 +323,10 @@ class IndexSchema:
         self.description = description
         self.fields: List[IndexField] = []
         self.folder_separator = "/"
+        self._revision = 0
+        self._filename_template = ""
+        self._compiled_template: Optional[List[Tuple[str, Optional[str]]]] = None
+        self._template_keys: Optional[FrozenSet[str]] = None
         self.filename_template = "{timestamp}_{sequential}"
         self.created_date = datetime.now()
         self.modified_date = datetime.now()
@@ -268,10 +337,82 @@ class IndexSchema:
         self.category = ""
         self.tags: List[str] = []
 
+        # Values derived from the field list, see _get_cached()
+        self._derived_cache: Dict[str, Any] = {}
+
+    @property
+    def revision(self) -> int:
+        """
+        Modification counter; compare values to detect changes.
+
+        Bumped by invalidate_caches() and when the filename template changes.
+        """
+        return self._revision
+
+    @property
+    def filename_template(self) -> str:
+        """Template used to build filenames, in str.format syntax."""
+        return self._filename_template
+
+    @filename_template.setter
+    def filename_template(self, template: str):
+        self._filename_template = template
+        self._compile_filename_template()
+        self._revision += 1
+
+    def _compile_filename_template(self):
+        """
+        Split the filename template into (literal, key) pairs once.
+
+        Templates using anything beyond plain {name} fields (format specs,
+        conversions, indexing, positional fields) are left uncompiled and
+        rendered with str.format, as are templates that fail to parse.
+        """
+        self._compiled_template = None
+        self._template_keys = None
+        try:
+            parsed = list(string.Formatter().parse(self._filename_template))
+        except (ValueError, TypeError):
+            return
+
+        compiled = []
+        for literal, key, format_spec, conversion in parsed:
+            if key is not None and (format_spec or conversion or not key or key.isdigit()
+                                    or '.' in key or '[' in key):
+                return
+            compiled.append((literal, key))
+
+        # 'timestamp' is always needed for the fallback filename
+        self._compiled_template = compiled
+        self._template_keys = frozenset(key for _, key in compiled if key is not None) | {'timestamp'}
+
+    def invalidate_caches(self):
+        """
+        Drop values derived from the field list.
+
+        Called automatically by add_field, remove_field and reorder_fields;
+        call it after editing self.fields or its fields in place.
+        """
+        self._derived_cache.clear()
+        self._revision += 1
+
+    def _get_cached(self, key: str, factory):
+        """Return a derived value, computing it with factory() on first use."""
+        try:
+            return self._derived_cache[key]
+        except KeyError:
+            value = self._derived_cache[key] = factory()
+            return value
+
+    def _fields_changed(self):
+        """Record a change to the field list."""
+        self.invalidate_caches()
+        self.modified_date = datetime.now()
+
     def add_field(self, field: IndexField):
         """Add a field to this schema."""
         # Check for duplicate names
-        if any(f.name == field.name for f in self.fields):
+        if field.name in self._get_fields_by_name():
             raise SchemaValidationError(f"Field '{field.name}' already exists")
 
         # Set display order if not specified
@@ -279,16 +420,16 @@ class IndexSchema:
             field.display_order = len(self.fields) + 1
 
         self.fields.append(field)
-        self.modified_date = datetime.now()
+        self._fields_changed()
 
     def remove_field(self, field_name: str) -> bool:
         """Remove a field by name. Returns True if found and removed."""
-        for i, field in enumerate(self.fields):
-            if field.name == field_name:
-                del self.fields[i]
-                self.modified_date = datetime.now()
-                return True
-        return False
+        field = self._get_fields_by_name().get(field_name)
+        if field is None:
+            return False
+        self.fields.remove(field)
+        self._fields_changed()
+        return True
 
     def reorder_fields(self, field_order: List[str]):
         """Reorder fields according to the provided list of field names."""
@@ -303,18 +444,52 @@ class IndexSchema:
         for i, field in enumerate(self.fields):
             field.display_order = i + 1
 
-        self.modified_date = datetime.now()
+        self._fields_changed()
 
     def get_field_by_name(self, name: str) -> Optional[IndexField]:
         """Retrieve a field by name."""
-        for field in self.fields:
-            if field.name == name:
-                return field
-        return None
+        return self._get_fields_by_name().get(name)
 
     def get_fields_by_role(self, role: FieldRole) -> List[IndexField]:
         """Get all fields with a specific role."""
-        return [f for f in self.fields if f.role == role]
+        return list(self._get_fields_by_role().get(role, ()))
+
+    def _get_fields_by_name(self) -> Dict[str, IndexField]:
+        """Map of field name to field, cached until the fields change."""
+        def build():
+            # First field wins, matching the old linear scan
+            by_name = {}
+            for field in self.fields:
+                by_name.setdefault(field.name, field)
+            return by_name
+        return self._get_cached('fields_by_name', build)
+
+    def _get_fields_by_role(self) -> Dict[FieldRole, List[IndexField]]:
+        """Fields grouped by role in list order, cached until the fields change."""
+        def build():
+            by_role = {}
+            for field in self.fields:
+                by_role.setdefault(field.role, []).append(field)
+            return by_role
+        return self._get_cached('fields_by_role', build)
+
+    def _get_template_keys_by_name(self) -> Dict[str, str]:
+        """Map of field name to template key, cached until the fields change."""
+        return self._get_cached(
+            'template_keys_by_name',
+            lambda: {field.name: field.template_key for field in self.fields}
+        )
+
+    def _get_sorted_fields(self, role: FieldRole) -> List[IndexField]:
+        """Fields with a role sorted by display order, cached until the fields change."""
+        sorted_by_role = self._get_cached(
+            'sorted_fields_by_role',
+            lambda: {
+                field_role: sorted(fields, key=lambda f: f.display_order)
+                for field_role, fields in self._get_fields_by_role().items()
+            }
+        )
+        return sorted_by_role.get(role, [])
 
     def validate_schema(self) -> tuple[bool, List[str]]:
         """
@@ -356,10 +531,8 @@ class IndexSchema:
                     errors.append(f"Default value for '{field.name}': {error}")
 
         # Check that we have at least one folder or filename field for organization
-        folder_fields = self.get_fields_by_role(FieldRole.FOLDER)
-        filename_fields = self.get_fields_by_role(FieldRole.FILENAME)
-
-        if not folder_fields and not filename_fields:
+        fields_by_role = self._get_fields_by_role()
+        if FieldRole.FOLDER not in fields_by_role and FieldRole.FILENAME not in fields_by_role:
             errors.append("Schema should have at least one folder or filename field")
 
         return len(errors) == 0, errors
@@ -375,12 +548,7 @@ class IndexSchema:
             str: Generated folder path
         """
         folder_parts = []
-        folder_fields = sorted(
-            self.get_fields_by_role(FieldRole.FOLDER),
-            key=lambda f: f.display_order
-        )
-
-        for field in folder_fields:
+        for field in self._get_sorted_fields(FieldRole.FOLDER):
             value = values.get(field.name, "").strip()
             if value:
                 # Clean the value for use in folder name
@@ -404,45 +572,64 @@ class IndexSchema:
         Returns:
             str: Generated filename (without extension)
         """
-        # Collect filename field values
+        # Collect filename field values with their template keys
         filename_parts = []
-        filename_fields = sorted(
-            self.get_fields_by_role(FieldRole.FILENAME),
-            key=lambda f: f.display_order
-        )
-
-        for field in filename_fields:
+        filename_part_keys = []
+        for field in self._get_sorted_fields(FieldRole.FILENAME):
             value = values.get(field.name, "").strip()
             if value:
                 clean_value = AppConstants.get_safe_filename(value)
                 if clean_value:
                     filename_parts.append(clean_value)
-
-        # Build template variables
-        template_vars = {
-            'timestamp': timestamp.strftime('%Y%m%d_%H%M%S') if timestamp else datetime.now().strftime('%Y%m%d_%H%M%S'),
-            'sequential': f"{sequential:03d}" if sequential is not None else "001",
-            'date': timestamp.strftime('%Y-%m-%d') if timestamp else datetime.now().strftime('%Y-%m-%d'),
-            'time': timestamp.strftime('%H-%M-%S') if timestamp else datetime.now().strftime('%H-%M-%S')
-        }
-
-        # Add field values to template variables
+                    filename_part_keys.append(field.template_key)
+
+        # Build template variables from a single clock reading, formatting
+        # only the ones the compiled template references
+        template_keys = self._template_keys
+        now = timestamp or datetime.now()
+        template_vars = {'timestamp': now.strftime('%Y%m%d_%H%M%S')}
+        if template_keys is None or 'sequential' in template_keys:
+            template_vars['sequential'] = f"{sequential:03d}" if sequential is not None else "001"
+        for key, date_format in _TEMPLATE_DATE_FORMATS:
+            if template_keys is None or key in template_keys:
+                template_vars[key] = now.strftime(date_format)
+
+        # Add field values to template variables, skipping keys the
+        # compiled template never references
+        key_by_name = self._get_template_keys_by_name()
         for field_name, value in values.items():
             if value and value.strip():
-                clean_value = AppConstants.get_safe_filename(value.strip())
-                template_vars[field_name.lower().replace(' ', '_')] = clean_value
-
-        # Generate filename from template
+                key = key_by_name.get(field_name)
+                if key is None:
+                    key = field_name.lower().replace(' ', '_')
+                if template_keys is None or key in template_keys:
+                    template_vars[key] = AppConstants.get_safe_filename(value.strip())
+
+        # Generate filename from template, noting when a filename part is
+        # known to be in the result so it need not be searched for
+        parts_included = False
         try:
-            filename = self.filename_template.format(**template_vars)
+            compiled = self._compiled_template
+            if compiled is None:
+                filename = self._filename_template.format(**template_vars)
+            else:
+                filename = ''.join(
+                    literal if key is None else literal + template_vars[key]
+                    for literal, key in compiled
+                )
+                parts_included = any(
+                    key in template_keys and template_vars.get(key) == part
+                    for key, part in zip(filename_part_keys, filename_parts)
+                )
         except KeyError as e:
             # Fall back to basic naming if template fails
             filename = f"{template_vars['timestamp']}"
             if filename_parts:
                 filename += f"_{'_'.join(filename_parts)}"
+                parts_included = True
 
         # Add filename parts if not already included
-        if filename_parts and not any(part in filename for part in filename_parts):
+        if filename_parts and not parts_included and not any(part in filename for part in filename_parts):
             filename += f"_{'_'.join(filename_parts)}"
 
         return AppConstants.get_safe_filename(filename)
@@ -502,17 +689,36 @@ class IndexSchema:
                 schema.fields.append(field)
             except Exception as e:
                 raise SchemaValidationError(f"Error loading field '{field_data.get('name', 'unknown')}': {e}")
+        schema.invalidate_caches()
 
         return schema
 
     def clone(self) -> 'IndexSchema':
         """Create a copy of this schema."""
-        return IndexSchema.from_json(self.to_json())
+        schema = IndexSchema(self.name, self.description)
+        schema.version = self.version
+        schema.author = self.author
+        schema.category = self.category
+        schema.tags = list(self.tags)
+        schema.folder_separator = self.folder_separator
+        schema.filename_template = self.filename_template
+        schema.created_date = self.created_date
+        schema.modified_date = self.modified_date
+        schema.fields = [field.clone() for field in self.fields]
+        return schema
 
     def get_required_fields(self) -> List[IndexField]:
         """Get all required fields in this schema."""
         return [f for f in self.fields if f.required]
 
+    @property
+    def required_field_names(self) -> FrozenSet[str]:
+        """Names of all required fields, cached until the fields change."""
+        return self._get_cached(
+            'required_field_names',
+            lambda: frozenset(f.name for f in self.fields if f.required)
+        )
+
     def validate_assignment_values(self, values: Dict[str, str]) -> tuple[bool, List[str]]:
         """
         Validate a complete set of assignment values against this schema.
@@ -536,12 +742,13 @@ class IndexSchema:
 
     def get_field_summary(self) -> Dict[str, int]:
         """Get summary statistics about fields in this schema."""
+        fields_by_role = self._get_fields_by_role()
         summary = {
             'total_fields': len(self.fields),
             'required_fields': len([f for f in self.fields if f.required]),
-            'folder_fields': len(self.get_fields_by_role(FieldRole.FOLDER)),
-            'filename_fields': len(self.get_fields_by_role(FieldRole.FILENAME)),
-            'metadata_fields': len(self.get_fields_by_role(FieldRole.METADATA)),
+            'folder_fields': len(fields_by_role.get(FieldRole.FOLDER, ())),
+            'filename_fields': len(fields_by_role.get(FieldRole.FILENAME, ())),
+            'metadata_fields': len(fields_by_role.get(FieldRole.METADATA, ())),
         }
 
         # Count by type
@@ -253,7 +253,7 @@ class DocumentProcessor(QObject):
 
                 # Update progress
                 progress = int(((i + 1) / len(assignments)) * 100)
-                app_signals.processing_progress.emit(progress, f"Processed {i + 1} of {len(assignments)} assignments")
+                app_signals.emit_processing_progress(progress, f"Processed {i + 1} of {len(assignments)} assignments")
 
             # Generate summary if requested
             if self.create_summary and not self.should_cancel:
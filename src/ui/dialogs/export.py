@@ -74,7 +74,7 @@ class ExportPreviewThread(QThread):
 
                 preview['folders'][folder_path].append(file_info)
                 preview['files'].append({
-                    'path': str(doc_preview.get_full_path()),
+                    'path': doc_preview.get_full_path_str(),
                     'pages': doc_preview.page_count,
                     'size': doc_preview.estimated_file_size
                 })
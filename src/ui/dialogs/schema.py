@@ -377,6 +377,9 @@ class SchemaDialog(QDialog):
 
     def _mark_changed(self):
         """Mark that schema has been changed."""
+        if self.current_schema:
+            # Fields may have been edited in place
+            self.current_schema.invalidate_caches()
         self.has_changes = True
         self.save_button.setEnabled(True)
 
@@ -88,7 +88,7 @@ class PreviewUpdateThread(QThread):
                 # File info
                 file_info = {
                     'name': f"{doc_preview.filename}.pdf",
-                    'full_path': str(doc_preview.get_full_path()),
+                    'full_path': doc_preview.get_full_path_str(),
                     'pages': doc_preview.page_count,
                     'size': doc_preview.estimated_file_size,
                     'assignment_id': assignment.assignment_id,
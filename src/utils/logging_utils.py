@@ -0,0 +1,62 @@
+"""
+Shared logging helpers.
+
+Builds the buffered file handler used by both the entry point and the
+application so startup log lines reach disk in a few writes.
+"""
+
+import logging
+import logging.handlers
+from pathlib import Path
+
+# Number of records buffered before the log file is written
+LOG_BUFFER_CAPACITY = 200
+
+
+def create_buffered_file_handler(log_file: Path, formatter: logging.Formatter,
+                                 level: int = logging.NOTSET) -> logging.handlers.MemoryHandler:
+    """
+    Create a file handler that buffers records in memory.
+
+    The buffer is written when it is full, when a WARNING or higher record
+    arrives, or at close. Call end_startup_buffering() once startup is done
+    to write out the buffer and log directly from then on.
+
+    Args:
+        log_file: Log file to append to
+        formatter: Formatter for file output
+        level: Minimum level for both handlers
+
+    Returns:
+        logging.handlers.MemoryHandler: Handler wrapping the file handler
+    """
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setLevel(level)
+    file_handler.setFormatter(formatter)
+
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=LOG_BUFFER_CAPACITY,
+        flushLevel=logging.WARNING,
+        target=file_handler,
+        flushOnClose=True
+    )
+    buffered_handler.setLevel(level)
+    return buffered_handler
+
+
+def end_startup_buffering():
+    """
+    Flush buffered handlers on the root logger and switch them to direct writes.
+
+    Each buffering handler is replaced by its target file handler, so records
+    logged after startup reach disk immediately and survive a hard crash.
+    """
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, logging.handlers.MemoryHandler) and handler.target is not None:
+            target = handler.target
+            handler.flush()
+            root.addHandler(target)
+            root.removeHandler(handler)
+            handler.setTarget(None)
+            handler.close()
@@ -43,6 +43,10 @@ class ValidationEngine:
             'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
         }
 
+        # Invalid character checks run as one regex scan per string
+        self._invalid_path_chars_re = self._compile_char_class(self._get_invalid_path_characters())
+        self._invalid_filename_chars_re = self._compile_char_class(self._get_invalid_filename_characters())
+
         logging.debug("ValidationEngine initialized")
 
     def validate_batch_assignments(self, batch) -> Tuple[bool, List[Dict[str, Any]]]:
@@ -409,16 +413,15 @@ class ValidationEngine:
                     })
 
                 # Check for invalid characters
-                invalid_chars = self._get_invalid_path_characters()
-                for char in invalid_chars:
-                    if char in str(path_obj):
-                        errors.append({
-                            'type': 'invalid_character_error',
-                            'path': path,
-                            'character': char,
-                            'message': f"Path contains invalid character '{char}': {path}"
-                        })
-                        break
+                invalid_match = self._invalid_path_chars_re.search(str(path_obj))
+                if invalid_match:
+                    char = invalid_match.group()
+                    errors.append({
+                        'type': 'invalid_character_error',
+                        'path': path,
+                        'character': char,
+                        'message': f"Path contains invalid character '{char}': {path}"
+                    })
 
                 # Check for reserved names (Windows)
                 if self.is_windows:
@@ -631,15 +634,13 @@ class ValidationEngine:
             })
 
         # Check for invalid characters
-        invalid_chars = self._get_invalid_filename_characters()
-        for char in invalid_chars:
-            if char in filename:
-                errors.append({
-                    'type': 'invalid_character_error',
-                    'filename': filename,
-                    'character': char,
-                    'message': f"Filename contains invalid character '{char}': {filename}"
-                })
+        for char in dict.fromkeys(self._invalid_filename_chars_re.findall(filename)):
+            errors.append({
+                'type': 'invalid_character_error',
+                'filename': filename,
+                'character': char,
+                'message': f"Filename contains invalid character '{char}': {filename}"
+            })
 
         # Check for reserved names
         if self.is_windows:
@@ -669,18 +670,21 @@ class ValidationEngine:
             })
 
         # Check for invalid characters
-        invalid_chars = self._get_invalid_path_characters()
-        for char in invalid_chars:
-            if char in component:
-                errors.append({
-                    'type': 'invalid_character_error',
-                    'component': component,
-                    'character': char,
-                    'message': f"Path component contains invalid character '{char}': {component}"
-                })
+        for char in dict.fromkeys(self._invalid_path_chars_re.findall(component)):
+            errors.append({
+                'type': 'invalid_character_error',
+                'component': component,
+                'character': char,
+                'message': f"Path component contains invalid character '{char}': {component}"
+            })
 
         return errors
 
+    @staticmethod
+    def _compile_char_class(chars: Set[str]) -> re.Pattern:
+        """Compile a regex matching any one of the given characters."""
+        return re.compile('[' + re.escape(''.join(sorted(chars))) + ']')
+
     def _get_invalid_filename_characters(self) -> Set[str]:
         """Get set of invalid filename characters for current OS."""
         if self.is_windows: